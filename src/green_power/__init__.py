@@ -1,6 +1,33 @@
 """Top-level package for the Green Power research toolkit."""
 
-from .config import PipelineConfig
-from .pipeline import GreenPowerPipeline
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .config import PipelineConfig
+    from .pipeline import GreenPowerPipeline
 
 __all__ = ["PipelineConfig", "GreenPowerPipeline"]
+
+# Public names resolve on first access, so importing a submodule such as
+# ``green_power.crawling.iem_crawler`` does not pull in the whole pipeline
+# (matplotlib, pandas, jieba, ...).
+_LAZY_ATTRS = {
+    "PipelineConfig": ".config",
+    "GreenPowerPipeline": ".pipeline",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,9 +5,10 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import os
 from dataclasses import replace
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 
 try:
     from dotenv import load_dotenv
@@ -18,8 +19,6 @@ except ImportError:  # pragma: no cover - optional dependency
 from .config import PipelineConfig
 from .pipeline import GreenPowerPipeline
 
-load_dotenv()
-
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(name)s - %(message)s",
@@ -43,6 +42,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="显示当前数据目录状态",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="重新生成全部图表，即使分析结果没有更新",
+    )
     parser.add_argument(
         "--dir",
         default="data",
@@ -97,7 +101,7 @@ def apply_overrides(config: PipelineConfig, args: argparse.Namespace) -> Pipelin
     if args.dir:
         kwargs["base_dir"] = Path(args.dir)
     if args.keywords:
-        kwargs["keywords"] = args.keywords
+        kwargs["keywords"] = tuple(args.keywords)
     if args.openai_model:
         kwargs["openai_model"] = args.openai_model
     if args.openai_base_url:
@@ -115,6 +119,15 @@ def apply_overrides(config: PipelineConfig, args: argparse.Namespace) -> Pipelin
     return replace(config, **kwargs)
 
 
+def _count_entries(directory: Path) -> Optional[int]:
+    """Number of entries in ``directory``, or ``None`` if it does not exist."""
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for _ in entries)
+    except FileNotFoundError:
+        return None
+
+
 def show_status(config: PipelineConfig) -> None:
     paths = config.paths()
     info: Dict[str, Dict[str, str]] = {}
@@ -124,16 +137,19 @@ def show_status(config: PipelineConfig) -> None:
         "analysis": paths.analysis_dir,
         "output": paths.output_dir,
     }.items():
-        files = list(directory.glob("*")) if directory.exists() else []
+        count = _count_entries(directory)
         info[name] = {
             "path": str(directory.resolve()),
-            "exists": str(directory.exists()),
-            "files": str(len(files)),
+            "exists": str(count is not None),
+            "files": str(count or 0),
         }
     print(json.dumps(info, ensure_ascii=False, indent=2))
 
 
 def main(argv: list[str] | None = None) -> None:
+    # .env only matters for command line runs; load it before PipelineConfig
+    # reads the OPENAI_* variables instead of on every package import.
+    load_dotenv()
     parser = build_parser()
     args = parser.parse_args(argv)
     config = apply_overrides(PipelineConfig(), args)
@@ -145,7 +161,7 @@ def main(argv: list[str] | None = None) -> None:
 
     try:
         if args.full:
-            pipeline.run_all()
+            pipeline.run_all(force=args.force)
         elif args.step:
             step = args.step
             if step == "crawl":
@@ -155,7 +171,7 @@ def main(argv: list[str] | None = None) -> None:
             elif step == "analyze":
                 pipeline.analyze()
             elif step == "report":
-                pipeline.report()
+                pipeline.report(force=args.force)
         else:
             parser.print_help()
     except Exception as exc:  # pragma: no cover - command line feedback
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 import os
 
@@ -47,13 +48,12 @@ class PipelinePaths:
         self.meta_dir = self.results_dir / "meta"
 
     def ensure_directories(self) -> None:
+        # Only the leaf directories are created; ``parents=True`` brings in
+        # base_dir, results_dir and output_dir along the way.
         for path in (
-            self.base_dir,
-            self.results_dir,
             self.raw_dir,
             self.processed_dir,
             self.analysis_dir,
-            self.output_dir,
             self.charts_dir,
             self.reports_dir,
             self.meta_dir,
@@ -61,16 +61,30 @@ class PipelinePaths:
             path.mkdir(parents=True, exist_ok=True)
 
 
-@dataclass(slots=True)
+@lru_cache(maxsize=None)
+def _prepared_paths(base_dir: Path) -> PipelinePaths:
+    """Build the directory layout for ``base_dir`` and create it once per process."""
+    paths = PipelinePaths(base_dir)
+    paths.ensure_directories()
+    return paths
+
+
+@dataclass(slots=True, frozen=True)
 class PipelineConfig:
-    """High-level configuration for the whole pipeline."""
+    """High-level configuration for the whole pipeline.
+
+    Instances are immutable and hashable; derive variants with
+    ``dataclasses.replace``.
+    """
 
     base_dir: Path = Path("data")
-    keywords: List[str] = field(default_factory=lambda: list(DEFAULT_KEYWORDS))
+    keywords: Tuple[str, ...] = tuple(DEFAULT_KEYWORDS)
     tavily_search_depth: str = "advanced"
     tavily_results_per_keyword: int = 10
     tavily_api_base_url: str = "https://api.tavily.com/search"
     tavily_request_timeout: int = 30
+    tavily_max_workers: int = 20
+    tavily_cache_ttl_seconds: int = 86400
     openai_api_key: Optional[str] = field(
         default_factory=lambda: os.getenv("OPENAI_API_KEY")
     )
@@ -88,9 +102,9 @@ class PipelineConfig:
     )
 
     def paths(self) -> PipelinePaths:
-        paths = PipelinePaths(self.base_dir)
-        paths.ensure_directories()
-        return paths
+        # The layout only depends on base_dir, so repeated calls (and configs
+        # derived via ``replace``) share one instance and skip the mkdir calls.
+        return _prepared_paths(self.base_dir)
 
     def timestamp(self) -> str:
         return datetime.now().strftime("%Y%m%d_%H%M%S")
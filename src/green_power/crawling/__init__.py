@@ -1,12 +1,18 @@
 """Crawling utilities."""
 
-from .noaa_crawler import (
-    NOAAArchiveCrawler,
-    NOAACompleteCrawler,
-    NOAAForecastExtractor,
-)
-from .tavily_crawler import TavilyCrawler
-from .iem_crawler import IEMTextProductCrawler
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - static analysis only
+    from .iem_crawler import IEMTextProductCrawler
+    from .noaa_crawler import (
+        NOAAArchiveCrawler,
+        NOAACompleteCrawler,
+        NOAAForecastExtractor,
+    )
+    from .tavily_crawler import TavilyCrawler
 
 __all__ = [
     "NOAAArchiveCrawler",
@@ -15,3 +21,26 @@ __all__ = [
     "TavilyCrawler",
     "IEMTextProductCrawler",
 ]
+
+# Each crawler depends on a different HTTP/parsing stack; import a crawler's
+# module only when that crawler is first requested.
+_LAZY_ATTRS = {
+    "NOAAArchiveCrawler": ".noaa_crawler",
+    "NOAACompleteCrawler": ".noaa_crawler",
+    "NOAAForecastExtractor": ".noaa_crawler",
+    "TavilyCrawler": ".tavily_crawler",
+    "IEMTextProductCrawler": ".iem_crawler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
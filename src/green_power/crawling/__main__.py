@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""IEM NWS Text Product Archive 交互式命令行入口.
+
+用法: ``python -m green_power.crawling``
+"""
+
+from datetime import datetime, timedelta
+
+from .iem_crawler import IEMTextProductCrawler
+
+
+def main():
+    """主函数"""
+    print("="*70)
+    print("IEM NWS Text Product Archive 爬虫")
+    print("="*70)
+    
+    # 创建爬虫
+    crawler = IEMTextProductCrawler()
+    
+    # 显示选项
+    print("\n选项:")
+    print("1. 列出可用产品类型")
+    print("2. 爬取单个产品类型")
+    print("3. 爬取多个产品类型")
+    print("4. 爬取MCD（Mesoscale Convective Discussion）")
+    print("5. 爬取AFD（Area Forecast Discussion）")
+    print("6. 查看已下载数据")
+    
+    choice = input("\n请选择 (1-6): ").strip()
+    
+    if choice == '1':
+        crawler.list_available_products()
+    
+    elif choice == '2':
+        pil = input("请输入产品代码 (如 MCD, AFD): ").strip().upper()
+        
+        start_date_str = input("请输入开始日期 (YYYY-MM-DD): ").strip()
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
+        
+        end_date_str = input("请输入结束日期 (YYYY-MM-DD, 回车使用开始日期): ").strip()
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d') if end_date_str else start_date
+        
+        center = input("请输入中心代码 (可选，如 DMX，回车跳过): ").strip().upper()
+        center = center if center else None
+        
+        crawler.crawl_products_by_date_range(
+            pil=pil,
+            start_date=start_date,
+            end_date=end_date,
+            center=center,
+        )
+    
+    elif choice == '3':
+        pils_str = input("请输入产品代码，用逗号分隔 (如 MCD,AFD,HWO): ").strip().upper()
+        pils = [p.strip() for p in pils_str.split(',')]
+        
+        start_date_str = input("请输入开始日期 (YYYY-MM-DD): ").strip()
+        start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
+        
+        end_date_str = input("请输入结束日期 (YYYY-MM-DD): ").strip()
+        end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
+        
+        center = input("请输入中心代码 (可选，回车跳过): ").strip().upper()
+        center = center if center else None
+        
+        crawler.crawl_multiple_products(
+            pils=pils,
+            start_date=start_date,
+            end_date=end_date,
+            center=center,
+        )
+    
+    elif choice == '4':
+        # 快速测试：爬取最近7天的MCD
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=7)
+        
+        print(f"\n爬取最近7天的MCD产品")
+        crawler.crawl_products_by_date_range(
+            pil='MCD',
+            start_date=start_date,
+            end_date=end_date,
+        )
+    
+    elif choice == '5':
+        # 爬取特定中心的AFD
+        center = input("请输入中心代码 (如 DMX): ").strip().upper()
+        
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=7)
+        
+        print(f"\n爬取最近7天 {center} 的AFD产品")
+        crawler.crawl_products_by_date_range(
+            pil='AFD',
+            start_date=start_date,
+            end_date=end_date,
+            center=center,
+        )
+    
+    elif choice == '6':
+        crawler.list_downloaded_data()
+    
+    else:
+        print("无效选择")
+
+
+if __name__ == "__main__":
+    main()
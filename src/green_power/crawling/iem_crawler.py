@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
-"""Iowa Environmental Mesonet (IEM) NWS Text Product Archive爬虫."""
+"""Iowa Environmental Mesonet (IEM) NWS Text Product Archive爬虫.
+
+``requests`` 与 ``bs4`` 在实际使用时才导入，作为库引用本模块不会承担其导入开销。
+交互式命令行入口位于 ``green_power.crawling.__main__``。
+"""
+
+from __future__ import annotations
 
 import re
 import time
@@ -8,9 +14,6 @@ from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from urllib.parse import urljoin, urlencode
 
-import requests
-from bs4 import BeautifulSoup
-
 
 class IEMTextProductCrawler:
     """从Iowa Environmental Mesonet (IEM) 获取NWS文本产品的爬虫"""
@@ -60,6 +63,8 @@ class IEMTextProductCrawler:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
+        import requests
+
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
@@ -164,6 +169,8 @@ class IEMTextProductCrawler:
         if not html:
             return []
         
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(html, 'html.parser')
         products = []
         
@@ -206,6 +213,8 @@ class IEMTextProductCrawler:
         if not html:
             return None
         
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(html, 'html.parser')
         
         # 产品文本通常在<pre>标签中
@@ -438,102 +447,3 @@ class IEMTextProductCrawler:
                     print(f"  {center}: {count} 个文件")
                 print(f"  总计: {total_files} 个文件")
 
-
-def main():
-    """主函数"""
-    print("="*70)
-    print("IEM NWS Text Product Archive 爬虫")
-    print("="*70)
-    
-    # 创建爬虫
-    crawler = IEMTextProductCrawler()
-    
-    # 显示选项
-    print("\n选项:")
-    print("1. 列出可用产品类型")
-    print("2. 爬取单个产品类型")
-    print("3. 爬取多个产品类型")
-    print("4. 爬取MCD（Mesoscale Convective Discussion）")
-    print("5. 爬取AFD（Area Forecast Discussion）")
-    print("6. 查看已下载数据")
-    
-    choice = input("\n请选择 (1-6): ").strip()
-    
-    if choice == '1':
-        crawler.list_available_products()
-    
-    elif choice == '2':
-        pil = input("请输入产品代码 (如 MCD, AFD): ").strip().upper()
-        
-        start_date_str = input("请输入开始日期 (YYYY-MM-DD): ").strip()
-        start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-        
-        end_date_str = input("请输入结束日期 (YYYY-MM-DD, 回车使用开始日期): ").strip()
-        end_date = datetime.strptime(end_date_str, '%Y-%m-%d') if end_date_str else start_date
-        
-        center = input("请输入中心代码 (可选，如 DMX，回车跳过): ").strip().upper()
-        center = center if center else None
-        
-        crawler.crawl_products_by_date_range(
-            pil=pil,
-            start_date=start_date,
-            end_date=end_date,
-            center=center,
-        )
-    
-    elif choice == '3':
-        pils_str = input("请输入产品代码，用逗号分隔 (如 MCD,AFD,HWO): ").strip().upper()
-        pils = [p.strip() for p in pils_str.split(',')]
-        
-        start_date_str = input("请输入开始日期 (YYYY-MM-DD): ").strip()
-        start_date = datetime.strptime(start_date_str, '%Y-%m-%d')
-        
-        end_date_str = input("请输入结束日期 (YYYY-MM-DD): ").strip()
-        end_date = datetime.strptime(end_date_str, '%Y-%m-%d')
-        
-        center = input("请输入中心代码 (可选，回车跳过): ").strip().upper()
-        center = center if center else None
-        
-        crawler.crawl_multiple_products(
-            pils=pils,
-            start_date=start_date,
-            end_date=end_date,
-            center=center,
-        )
-    
-    elif choice == '4':
-        # 快速测试：爬取最近7天的MCD
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=7)
-        
-        print(f"\n爬取最近7天的MCD产品")
-        crawler.crawl_products_by_date_range(
-            pil='MCD',
-            start_date=start_date,
-            end_date=end_date,
-        )
-    
-    elif choice == '5':
-        # 爬取特定中心的AFD
-        center = input("请输入中心代码 (如 DMX): ").strip().upper()
-        
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=7)
-        
-        print(f"\n爬取最近7天 {center} 的AFD产品")
-        crawler.crawl_products_by_date_range(
-            pil='AFD',
-            start_date=start_date,
-            end_date=end_date,
-            center=center,
-        )
-    
-    elif choice == '6':
-        crawler.list_downloaded_data()
-    
-    else:
-        print("无效选择")
-
-
-if __name__ == "__main__":
-    main()
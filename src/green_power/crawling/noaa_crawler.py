@@ -1,15 +1,202 @@
 #!/usr/bin/env python3
 """NOAA飓风数据抓取与提取相关工具集合."""
 
+import asyncio
+import hashlib
+import os
+import queue
+import random
 import re
+import threading
 import time
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime
+from html import unescape
 from urllib.parse import urljoin
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import etree
+from lxml import html as lxml_html
+
+from ..utils.aio import loop_running
+from ..utils.io import read_json, write_json, write_text_atomic
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+# BeautifulSoup解析器：基于C实现的lxml比纯Python的html.parser快数倍
+_PARSER = "lxml"
+
+# 只为实际访问的标签建树，跳过页面其余部分
+# 年份页面需要表格结构（table/tr/th/td）和其中的链接；atcf_index 注释位于单元格内，随之保留
+_YEAR_STRAINER = SoupStrainer(["table", "tr", "th", "td", "a"])
+_ADV_STRAINER = SoupStrainer("a", href=True)
+_PRE_STRAINER = SoupStrainer("pre")
+
+# NOAA预报页面的正文几乎总是单独的<pre>块，用正则直接截取可免去建树
+_PRE_RE = re.compile(r"<pre[^>]*>(.*?)</pre>", re.IGNORECASE | re.DOTALL)
+
+
+def _extract_pre_text(html: str) -> Optional[str]:
+    """用正则提取最长的<pre>文本；没有<pre>或其中嵌套标签时返回None，交由BeautifulSoup处理."""
+    blocks = _PRE_RE.findall(html)
+    if not blocks:
+        return None
+
+    longest = max(blocks, key=len)
+    if "<" in longest:
+        return None
+
+    return unescape(longest).strip()
+
+
+# NOAA预报页面正文所在的div（任一class匹配即可），按文档顺序返回
+_FORECAST_DIV_XPATH = etree.XPath(
+    "//div[" + " or ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+        for cls in ("textproduct", "text-product", "forecast-text")
+    ) + "]"
+)
+
+
+def _lxml_root(html: str):
+    """用lxml.html直接建树；文档为空或无法解析时返回None."""
+    try:
+        return lxml_html.fromstring(html)
+    except ValueError:
+        # 带有XML编码声明的str文档lxml不接受，改为传入字节
+        try:
+            return lxml_html.fromstring(html.encode("utf-8"))
+        except (ValueError, etree.ParserError):
+            return None
+    except etree.ParserError:
+        return None
+
+
+def _configure_session(session: requests.Session) -> requests.Session:
+    """为会话挂载连接池与自动重试，复用keep-alive连接并处理NOAA的临时性5xx错误."""
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Accept-Encoding"] = "gzip, deflate"
+    return session
+
+
+def _sorted_subdirs(path) -> List[os.DirEntry]:
+    """按名称排序列出子目录；DirEntry.is_dir 直接使用目录项类型，无需逐个 stat."""
+    with os.scandir(path) as entries:
+        return sorted(
+            (
+                entry for entry in entries
+                if entry.is_dir(follow_symlinks=False) and not entry.name.startswith(".")
+            ),
+            key=lambda entry: entry.name,
+        )
+
+
+def _response_text(response: requests.Response) -> str:
+    """按UTF-8解码响应内容；NOAA页面均为ASCII/UTF-8，无需requests逐个响应猜测编码."""
+    return response.content.decode("utf-8", errors="replace")
+
+
+def _load_cache_meta(cache_meta_path: Optional[Path]) -> Dict[str, str]:
+    """读取上次请求保存的 ETag/Last-Modified 及页面内容，不存在时返回空字典."""
+    if cache_meta_path is None or not cache_meta_path.exists():
+        return {}
+    try:
+        return read_json(cache_meta_path)
+    except (OSError, ValueError):
+        return {}
+
+
+def _conditional_headers(cache_meta: Dict[str, str]) -> Dict[str, str]:
+    """根据缓存元数据构造条件请求头."""
+    headers = {}
+    if cache_meta.get("etag"):
+        headers["If-None-Match"] = cache_meta["etag"]
+    if cache_meta.get("last_modified"):
+        headers["If-Modified-Since"] = cache_meta["last_modified"]
+    return headers
+
+
+def _store_cache_meta(cache_meta_path: Optional[Path], response_headers, body: str) -> None:
+    """服务器提供了 ETag/Last-Modified 时，保存它们和页面内容供下次条件请求使用."""
+    if cache_meta_path is None:
+        return
+    etag = response_headers.get("ETag")
+    last_modified = response_headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+    write_json(
+        cache_meta_path,
+        {"etag": etag, "last_modified": last_modified, "body": body},
+    )
+
+
+@lru_cache(maxsize=256)
+def _legacy_link_patterns(year: int) -> Tuple[re.Pattern, ...]:
+    """旧格式年份页面中气旋链接的正则，进程内按年份缓存."""
+    # 旧格式有多种链接模式:
+    # 1998-1998: {year}{NAME}adv.html (例: 1998ALEXadv.html)
+    # 1999-2002: {NAME}.html (例: ARLENE.html)
+    # 2003-2007: {year}{NAME}.shtml (例: 2003ANA.shtml)
+    return (
+        re.compile(rf"{year}([A-Z]+)adv\.html"),       # 1998格式
+        re.compile(r"([A-Z]+)\.html"),                # 1999-2002格式
+        re.compile(rf"{year}([A-Z]+)\.shtml"),         # 2003-2007格式
+        re.compile(r"([A-Z]+)\.shtml"),               # 另一种旧格式
+    )
+
+
+@lru_cache(maxsize=4096)
+def _advisory_patterns(
+    cyclone_id: str, year: int, format_type: str, data_types: Tuple[str, ...]
+) -> Tuple[Tuple[str, Tuple[re.Pattern, ...]], ...]:
+    """气旋页面中各类预报文件链接的正则 ((短名称, 正则组), ...)，任一匹配即视为该类型.
+
+    进程内按 (cyclone_id, year, format_type, data_types) 缓存，重试和重复爬取时不再编译.
+    """
+    table = []
+    for short_name in data_types:
+        if format_type == "legacy":
+            # 2003-2007年的文件名包含完整的短名称
+            # wndprb在2003-2007年可能叫prblty
+            type_names = [short_name]
+            if short_name == "wndprb":
+                type_names.append("prblty")
+
+            patterns = []
+            for type_name in type_names:
+                # 2003-2006: /archive/2003/mar/al012003.fstadv.001.shtml
+                # 2007: /archive/2007/al01/al012007.fstadv.001.shtml
+                patterns.append(rf"/archive/{year}/[a-z]+/{cyclone_id}{year}\.{type_name}\.\d{{3}}\.shtml")
+                patterns.append(rf"/archive/{year}/{cyclone_id}/{cyclone_id}{year}\.{type_name}\.\d{{3}}\.shtml")
+        else:
+            # 匹配预报文件格式: ep012023.discus.001.shtml（4位或2位年份）
+            patterns = [
+                rf"{cyclone_id}{year}\.{short_name}\.\d{{3}}\.shtml",
+                rf"{cyclone_id}{str(year)[-2:]}\.{short_name}\.\d{{3}}\.shtml",
+            ]
+        table.append((short_name, tuple(re.compile(pattern) for pattern in patterns)))
+
+    return tuple(table)
 
 
 class NOAACompleteCrawler:
@@ -30,18 +217,57 @@ class NOAACompleteCrawler:
         'cp': 'C_Pacific',
     }
     
+    # 新格式年份页面中的 atcf_index 注释（及其后的气旋链接），以及气旋名称前的强度前缀
+    _ATCF_INDEX_RE = re.compile(r'atcf_index=([a-z]{2}\d{2})')
+    _ATCF_LINK_RE = re.compile(
+        r'atcf_index=([a-z]{2}\d{2})[^<]*?<a\s+href="([^"]+)"[^>]*>([^<]+)</a>',
+        re.IGNORECASE | re.DOTALL,
+    )
+    _STORM_PREFIX_RE = re.compile(r'^(Hurricane|Tropical Storm|Tropical Depression)\s+')
+    
+    # 2003-2007年页面中真实的气旋ID（如 al012003 -> al01）
+    _REAL_ID_RE = re.compile(r'(al|ep|cp)(\d{2})\d{4}')
+    
+    # 旧格式(1998-2002)预报文件链接: archive/{目录}/{字母}{数字}.{数字}[.html]
+    # - archive/mar/MAL0198.001 (1998年格式，无扩展名)
+    # - /archive/1999/mar/MAL0199.001.html (1999+格式，有扩展名)
+    _LEGACY_DIR_RES = {
+        data_type: re.compile(rf'archive(/\d{{4}})?/{legacy_dir}/[A-Z]+\d+\.\d+(\.html)?')
+        for legacy_dir, data_type in {
+            'mar': 'fstadv',     # Marine/Forecast Advisory -> fstadv
+            'pub': 'public',     # Public Advisory -> public
+            'dis': 'discus',     # Discussion -> discus
+            'prb': 'wndprb',     # Probabilities -> wndprb
+        }.items()
+    }
+    
     def __init__(self, base_url="https://www.nhc.noaa.gov/archive/",
-                 output_dir="data/output/raw/noaa_complete"):
+                 output_dir="data/output/raw/noaa_complete",
+                 concurrency: int = 8, request_delay: float = 0.3):
+        """
+        Args:
+            base_url: NOAA档案基础URL
+            output_dir: 输出目录路径
+            concurrency: 对NOAA的最大并发数（异步请求数 / 同步路径下并行处理的气旋数）
+            request_delay: 相邻两次下载之间的间隔秒数，避免请求过快；同步路径下由所有
+                线程共享，整体下载速率不随concurrency增加（异步路径下为每次下载后的最大随机等待）
+        """
         self.base_url = base_url
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.concurrency = concurrency
+        self.request_delay = request_delay
         
-        self.session = requests.Session()
+        self.session = _configure_session(requests.Session())
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
-        # 统计信息
+        # 统计信息（同步路径下多个气旋并行处理，更新时需加锁）
+        self._stats_lock = threading.Lock()
+        # 同步路径的下载限速：各线程共享下一次允许发起下载的时间点
+        self._rate_lock = threading.Lock()
+        self._next_download_at = 0.0
         self.stats = {
             'years_processed': 0,
             'cyclones_processed': 0,
@@ -49,33 +275,97 @@ class NOAACompleteCrawler:
             'files_failed': 0
         }
     
-    def fetch_page(self, url: str, follow_redirects: bool = True) -> Optional[str]:
-        """获取网页HTML"""
+    @staticmethod
+    def _meta_refresh_url(html: str, url: str) -> Optional[str]:
+        """检查是否有meta refresh重定向（早期年份使用这种方式），返回重定向URL"""
+        if 'meta http-equiv="refresh"' in html.lower():
+            # 提取重定向URL
+            match = re.search(r'content="0;URL=([^"]+)"', html, re.IGNORECASE)
+            if match:
+                redirect_url = match.group(1)
+                if not redirect_url.startswith('http'):
+                    # 相对路径，需要拼接
+                    redirect_url = urljoin(url, redirect_url)
+                return redirect_url
+        return None
+    
+    def _http_cache_path(self, url: str) -> Path:
+        """索引页面条件请求元数据的缓存路径（按URL哈希存放在输出目录下）"""
+        digest = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        return self.output_dir / '.http_cache' / f'{digest}.json'
+    
+    def fetch_page(self, url: str, follow_redirects: bool = True,
+                   cache_meta_path: Optional[Path] = None) -> Optional[str]:
+        """
+        获取网页HTML
+        
+        Args:
+            url: 页面URL
+            follow_redirects: 是否跟随HTTP重定向
+            cache_meta_path: 条件请求缓存文件；提供时发送 If-None-Match/If-Modified-Since，
+                服务器返回304则直接使用缓存内容
+        """
         try:
-            response = self.session.get(url, timeout=30, allow_redirects=follow_redirects)
-            response.raise_for_status()
+            cache_meta = _load_cache_meta(cache_meta_path)
+            response = self.session.get(
+                url,
+                timeout=30,
+                allow_redirects=follow_redirects,
+                headers=_conditional_headers(cache_meta),
+            )
+            
+            if response.status_code == 304 and 'body' in cache_meta:
+                html = cache_meta['body']
+            else:
+                response.raise_for_status()
+                html = _response_text(response)
+                _store_cache_meta(cache_meta_path, response.headers, html)
             
-            # 检查是否有meta refresh重定向（早期年份使用这种方式）
-            if 'meta http-equiv="refresh"' in response.text.lower():
-                # 提取重定向URL
-                match = re.search(r'content="0;URL=([^"]+)"', response.text, re.IGNORECASE)
-                if match:
-                    redirect_url = match.group(1)
-                    if not redirect_url.startswith('http'):
-                        # 相对路径，需要拼接
-                        from urllib.parse import urljoin
-                        redirect_url = urljoin(url, redirect_url)
-                    # 重新获取重定向后的页面
-                    return self.fetch_page(redirect_url, follow_redirects=False)
+            redirect_url = self._meta_refresh_url(html, url)
+            if redirect_url:
+                # 重新获取重定向后的页面
+                return self.fetch_page(redirect_url, follow_redirects=False)
             
-            return response.text
+            return html
+        except Exception as e:
+            print(f"✗ 获取失败 {url}: {e}")
+            return None
+    
+    async def _afetch(self, session, url: str, follow_redirects: bool = True,
+                      cache_meta_path: Optional[Path] = None) -> Optional[str]:
+        """异步获取网页HTML（aiohttp版本的fetch_page）"""
+        try:
+            # 缓存读写、解析与磁盘I/O放到线程中执行，不阻塞其他下载
+            cache_meta = await asyncio.to_thread(_load_cache_meta, cache_meta_path)
+            async with session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=30),
+                allow_redirects=follow_redirects,
+                headers=_conditional_headers(cache_meta),
+            ) as response:
+                if response.status == 304 and 'body' in cache_meta:
+                    html = cache_meta['body']
+                else:
+                    response.raise_for_status()
+                    html = await response.text(encoding='utf-8', errors='replace')
+                    await asyncio.to_thread(_store_cache_meta, cache_meta_path, response.headers, html)
         except Exception as e:
             print(f"✗ 获取失败 {url}: {e}")
             return None
+        
+        redirect_url = self._meta_refresh_url(html, url)
+        if redirect_url:
+            return await self._afetch(session, redirect_url, follow_redirects=False)
+        
+        return html
     
     def extract_text_from_html(self, html: str) -> Optional[str]:
         """从HTML中提取预报文本（在<pre>标签中）"""
-        soup = BeautifulSoup(html, 'html.parser')
+        text = _extract_pre_text(html)
+        if text is not None:
+            return text
+        
+        soup = BeautifulSoup(html, _PARSER, parse_only=_PRE_STRAINER)
         pre_tags = soup.find_all('pre')
         
         if pre_tags:
@@ -87,61 +377,83 @@ class NOAACompleteCrawler:
     def get_year_cyclones(self, year: int) -> List[Dict[str, str]]:
         """获取指定年份的所有气旋信息，按海区组织"""
         year_url = f"{self.base_url}{year}/"
-        html = self.fetch_page(year_url)
+        html = self.fetch_page(year_url, cache_meta_path=self._http_cache_path(year_url))
         
         if not html:
             return []
         
-        soup = BeautifulSoup(html, 'html.parser')
-        cyclones = []
+        return self.parse_year_cyclones(html, year)
+    
+    def parse_year_cyclones(self, html: str, year: int) -> List[Dict[str, str]]:
+        """解析年份索引页面，提取所有气旋信息"""
+        year_url = f"{self.base_url}{year}/"
+        
+        # 方法1: 新格式 (2008年之后) - 直接在原始HTML中匹配 atcf_index 注释及其后的链接，无需建树
+        cyclones = [
+            self._atcf_cyclone(
+                match.group(1).lower(),
+                unescape(match.group(2)),
+                unescape(match.group(3)).strip(),
+                year_url,
+            )
+            for match in self._ATCF_LINK_RE.finditer(html)
+        ]
+        
+        # 其余情况（包括旧格式）交由BeautifulSoup解析
+        if not cyclones:
+            cyclones = self._parse_year_cyclones_soup(html, year, year_url)
+        
+        # 按海区统计
+        basin_counts = Counter(cyclone.get('basin', 'Unknown') for cyclone in cyclones)
+        
+        print(f"  找到 {len(cyclones)} 个气旋", end='')
+        if basin_counts:
+            basin_summary = ', '.join(f"{basin}: {count}" for basin, count in sorted(basin_counts.items()))
+            print(f" ({basin_summary})")
+        else:
+            print()
+        
+        return cyclones
+    
+    def _atcf_cyclone(self, cyclone_id: str, href: str, name: str, year_url: str) -> Dict[str, str]:
+        """根据 atcf_index 气旋ID及其链接构造新格式气旋信息"""
+        basin_code = cyclone_id[:2]  # 提取海区代码 (al, ep, cp等)
         
-        # 首先找到所有海区表头 (th元素，id为al/ep/cp等)
-        basin_headers = {}
-        for th in soup.find_all('th', id=True):
-            basin_id = th.get('id', '').lower()
-            if basin_id in self.BASIN_NAMES:
-                basin_headers[basin_id] = th
+        return {
+            'id': cyclone_id,
+            'name': self._STORM_PREFIX_RE.sub('', name),
+            'full_name': name,
+            'url': urljoin(year_url, href),
+            'format': 'new',
+            # 确定气旋所属的海区
+            'basin': self.BASIN_NAMES.get(basin_code, 'Unknown'),
+            'basin_code': basin_code
+        }
+    
+    def _parse_year_cyclones_soup(self, html: str, year: int, year_url: str) -> List[Dict[str, str]]:
+        """用BeautifulSoup解析年份索引页面（atcf_index正则未命中时使用）"""
+        soup = BeautifulSoup(html, _PARSER, parse_only=_YEAR_STRAINER)
+        cyclones = []
         
-        # 方法1: 新格式 (2008年之后) - 使用 atcf_index 注释
+        # 方法1（备用）: 新格式 (2008年之后) - 在解析树中查找 atcf_index 注释
         for comment in soup.find_all(string=lambda text: isinstance(text, str) and 'atcf_index=' in text):
-            match = re.search(r'atcf_index=([a-z]{2}\d{2})', comment)
+            match = self._ATCF_INDEX_RE.search(comment)
             if match:
-                cyclone_id = match.group(1)
-                basin_code = cyclone_id[:2]  # 提取海区代码 (al, ep, cp等)
-                
                 next_element = comment.next_sibling
                 if next_element and next_element.name == 'a':
-                    href = next_element.get('href', '')
-                    name = next_element.get_text(strip=True)
-                    name_only = re.sub(r'^(Hurricane|Tropical Storm|Tropical Depression)\s+', '', name)
-                    
-                    # 确定气旋所属的海区
-                    basin_name = self.BASIN_NAMES.get(basin_code, 'Unknown')
-                    
-                    cyclones.append({
-                        'id': cyclone_id,
-                        'name': name_only,
-                        'full_name': name,
-                        'url': urljoin(year_url, href),
-                        'format': 'new',
-                        'basin': basin_name,
-                        'basin_code': basin_code
-                    })
+                    cyclones.append(self._atcf_cyclone(
+                        match.group(1),
+                        next_element.get('href', ''),
+                        next_element.get_text(strip=True),
+                        year_url,
+                    ))
         
         # 方法2: 旧格式 (2007年及之前) - 查找特定模式的链接
         if not cyclones:
-            # 旧格式有多种链接模式:
-            # 1998-1998: {year}{NAME}adv.html (例: 1998ALEXadv.html)
-            # 1999-2002: {NAME}.html (例: ARLENE.html)
-            # 2003-2007: {year}{NAME}.shtml (例: 2003ANA.shtml)
-            
-            # 尝试多种模式
-            patterns = [
-                rf'{year}([A-Z]+)adv\.html',       # 1998格式
-                rf'([A-Z]+)\.html',                # 1999-2002格式
-                rf'{year}([A-Z]+)\.shtml',         # 2003-2007格式
-                rf'([A-Z]+)\.shtml',               # 另一种旧格式
-            ]
+            # 旧格式有多种链接模式，尝试所有模式
+            patterns = _legacy_link_patterns(year)
+            # 已添加的气旋ID，用于O(1)去重
+            seen_ids = set()
             
             # 首先尝试查找有 headers 属性的 td 元素（部分旧格式使用）
             td_with_headers = soup.find_all('td', headers=True)
@@ -161,19 +473,19 @@ class NOAACompleteCrawler:
                         current_basin = self.BASIN_NAMES[headers_attr]
                         current_basin_code = headers_attr
                     
-                    # 尝试所有模式
-                    for pattern in patterns:
-                        for link in td.find_all('a', href=re.compile(pattern)):
-                            href = link.get('href', '')
-                            text = link.get_text(strip=True)
-                            
-                            match = re.search(pattern, href)
+                    # 遍历一次链接，依次尝试所有模式
+                    for link in td.find_all('a', href=True):
+                        href = link['href']
+                        for pattern in patterns:
+                            match = pattern.search(href)
                             if match:
+                                text = link.get_text(strip=True)
                                 cyclone_name = match.group(1)
                                 
                                 # 避免重复添加
                                 cyclone_id = f'legacy_{year}_{cyclone_name.lower()}'
-                                if not any(c['id'] == cyclone_id for c in cyclones):
+                                if cyclone_id not in seen_ids:
+                                    seen_ids.add(cyclone_id)
                                     cyclones.append({
                                         'id': cyclone_id,
                                         'name': cyclone_name,
@@ -183,6 +495,7 @@ class NOAACompleteCrawler:
                                         'basin': current_basin,
                                         'basin_code': current_basin_code
                                     })
+                                break
             else:
                 # 没有 headers 属性，需要通过表格结构推断海区
                 # 旧格式通常是：一行标题（多个th），下一行数据（多个td，按列对应）
@@ -196,11 +509,9 @@ class NOAACompleteCrawler:
                     data_rows = []
                     
                     for row in rows:
-                        # 先找有id的th
-                        ths = row.find_all('th', id=True)
-                        if not ths:
-                            # 如果没有id，找所有th（用于1999-2002这种格式）
-                            ths = row.find_all('th')
+                        # 先找有id的th；如果没有id，使用所有th（用于1999-2002这种格式）
+                        all_ths = row.find_all('th')
+                        ths = [th for th in all_ths if th.has_attr('id')] or all_ths
                         
                         if ths:
                             # 这是标题行，记录每列对应的海区
@@ -254,19 +565,19 @@ class NOAACompleteCrawler:
                                     'code': 'al'
                                 })
                                 
-                                # 在当前单元格中查找气旋链接，尝试所有模式
-                                for pattern in patterns:
-                                    for link in td.find_all('a', href=re.compile(pattern)):
-                                        href = link.get('href', '')
-                                        text = link.get_text(strip=True)
-                                        
-                                        match = re.search(pattern, href)
+                                # 在当前单元格中查找气旋链接，依次尝试所有模式
+                                for link in td.find_all('a', href=True):
+                                    href = link['href']
+                                    for pattern in patterns:
+                                        match = pattern.search(href)
                                         if match:
+                                            text = link.get_text(strip=True)
                                             cyclone_name = match.group(1)
                                             
                                             # 避免重复添加
                                             cyclone_id = f'legacy_{year}_{cyclone_name.lower()}'
-                                            if not any(c['id'] == cyclone_id for c in cyclones):
+                                            if cyclone_id not in seen_ids:
+                                                seen_ids.add(cyclone_id)
                                                 cyclones.append({
                                                     'id': cyclone_id,
                                                     'name': cyclone_name,
@@ -276,112 +587,59 @@ class NOAACompleteCrawler:
                                                     'basin': basin_info['name'],
                                                     'basin_code': basin_info['code']
                                                 })
-        
-        # 按海区统计
-        basin_counts = {}
-        for cyclone in cyclones:
-            basin = cyclone.get('basin', 'Unknown')
-            basin_counts[basin] = basin_counts.get(basin, 0) + 1
-        
-        print(f"  找到 {len(cyclones)} 个气旋", end='')
-        if basin_counts:
-            basin_summary = ', '.join([f"{basin}: {count}" for basin, count in sorted(basin_counts.items())])
-            print(f" ({basin_summary})")
-        else:
-            print()
+                                            break
         
         return cyclones
     
     def get_cyclone_advisories(self, cyclone_url: str, cyclone_id: str, year: int, format_type: str = 'new') -> Dict[str, List[str]]:
         """获取指定气旋的所有预报文件链接"""
-        html = self.fetch_page(cyclone_url)
+        html = self.fetch_page(cyclone_url, cache_meta_path=self._http_cache_path(cyclone_url))
         
         if not html:
             return {}
         
-        soup = BeautifulSoup(html, 'html.parser')
-        advisories = {data_type: [] for data_type in self.DATA_TYPES.keys()}
+        return self.parse_cyclone_advisories(html, cyclone_url, cyclone_id, year, format_type)
+    
+    def parse_cyclone_advisories(self, html: str, cyclone_url: str, cyclone_id: str, year: int, format_type: str = 'new') -> Dict[str, List[str]]:
+        """解析气旋页面，提取所有预报文件链接"""
+        soup = BeautifulSoup(html, _PARSER, parse_only=_ADV_STRAINER)
+        data_types = tuple(self.DATA_TYPES)
+        advisories = {data_type: [] for data_type in data_types}
+        
+        # 只遍历一次解析树，后续各分支复用同一链接列表
+        hrefs = [link['href'] for link in soup.find_all('a', href=True)]
         
-        if format_type == 'legacy':
-            # 旧格式: 页面包含指向各个预报文件的链接
-            # 有多种子格式:
-            # 1. 1998格式: archive/mar/MAL0198.001 (纯文本文件)
-            # 2. 1999-2002格式: /archive/1999/mar/MAL0199.001.html (HTML文件)
-            # 3. 2003-2007格式: /archive/2003/mar/al012003.fstadv.001.shtml (类似新格式)
-            
+        # 新格式: 预报文件格式如 ep012023.discus.001.shtml
+        # 旧格式: 页面包含指向各个预报文件的链接，有多种子格式:
+        # 1. 1998格式: archive/mar/MAL0198.001 (纯文本文件)
+        # 2. 1999-2002格式: /archive/1999/mar/MAL0199.001.html (HTML文件)
+        # 3. 2003-2007格式: /archive/2003/mar/al012003.fstadv.001.shtml (类似新格式)
+        match_id = cyclone_id
+        if format_type == 'legacy' and year >= 2003:
             # 对于2003-2007年，尝试从页面内容中提取真实的气旋ID（如 al01）
-            real_cyclone_id = cyclone_id
-            if year >= 2003:
-                id_match = re.search(r'(al|ep|cp)(\d{2})\d{4}', html)
-                if id_match:
-                    real_cyclone_id = id_match.group(1) + id_match.group(2)
-            
-            # 先尝试新格式风格的链接（2003-2007）
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                
-                # 匹配2003-2007格式: /archive/2003/mar/al012003.fstadv.001.shtml
-                year_2digit = str(year)[-2:]
-                
-                for short_name in self.DATA_TYPES.keys():
-                    # 2003-2007年的文件名包含完整的短名称
-                    # wndprb在2003-2007年可能叫prblty
-                    type_patterns = [short_name]
-                    if short_name == 'wndprb':
-                        type_patterns.append('prblty')
-                    
-                    for type_name in type_patterns:
-                        # 2003-2006: /archive/2003/mar/al012003.fstadv.001.shtml
-                        # 2007: /archive/2007/al01/al012007.fstadv.001.shtml
-                        pattern1 = rf'/archive/{year}/[a-z]+/{real_cyclone_id}{year}\.{type_name}\.\d{{3}}\.shtml'
-                        pattern2 = rf'/archive/{year}/{real_cyclone_id}/{real_cyclone_id}{year}\.{type_name}\.\d{{3}}\.shtml'
-                        
-                        if re.search(pattern1, href) or re.search(pattern2, href):
-                            full_url = urljoin(cyclone_url, href)
-                            advisories[short_name].append(full_url)
-                            break  # 找到一个就跳出type_patterns循环
-            
-            # 如果没有找到文件，尝试旧格式链接（1998-2002）
-            if not any(advisories.values()):
-                # 定义旧格式的目录映射
-                legacy_dir_mapping = {
-                    'mar': 'fstadv',     # Marine/Forecast Advisory -> fstadv
-                    'pub': 'public',     # Public Advisory -> public
-                    'dis': 'discus',     # Discussion -> discus
-                    'prb': 'wndprb',     # Probabilities -> wndprb
-                }
-                
-                # 查找所有链接
-                for link in soup.find_all('a', href=True):
-                    href = link['href']
-                    
-                    # 匹配旧格式链接模式，支持多种格式:
-                    # - archive/mar/MAL0198.001 (1998年格式，无扩展名)
-                    # - /archive/1999/mar/MAL0199.001.html (1999+格式，有扩展名)
-                    for legacy_dir, data_type in legacy_dir_mapping.items():
-                        # 匹配模式：archive/{目录}/{字母}{数字}.{数字}[.html]
-                        pattern = rf'archive(/\d{{4}})?/{legacy_dir}/[A-Z]+\d+\.\d+(\.html)?'
-                        if re.search(pattern, href):
-                            full_url = urljoin(cyclone_url, href)
-                            advisories[data_type].append(full_url)
+            id_match = self._REAL_ID_RE.search(html)
+            if id_match:
+                match_id = id_match.group(1) + id_match.group(2)
+        
+        # 先按新格式风格匹配（包括2003-2007旧格式）
+        # 这类文件名必然包含气旋ID和“.shtml”，先用子串预筛，只对候选链接运行正则
+        advisory_res = _advisory_patterns(match_id, year, format_type, data_types)
+        for href in hrefs:
+            if match_id not in href or '.shtml' not in href:
+                continue
             
-        else:
-            # 新格式: 查找所有预报文件链接
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                
-                # 匹配预报文件格式: ep012023.discus.001.shtml
-                year_2digit = str(year)[-2:]
-                
-                for short_name in self.DATA_TYPES.keys():
-                    # 尝试4位年份
-                    pattern1 = rf'{cyclone_id}{year}\.{short_name}\.\d{{3}}\.shtml'
-                    # 尝试2位年份
-                    pattern2 = rf'{cyclone_id}{year_2digit}\.{short_name}\.\d{{3}}\.shtml'
-                    
-                    if re.search(pattern1, href) or re.search(pattern2, href):
+            for short_name, patterns in advisory_res:
+                if any(pattern.search(href) for pattern in patterns):
+                    full_url = urljoin(cyclone_url, href)
+                    advisories[short_name].append(full_url)
+        
+        # 旧格式如果没有找到文件，尝试1998-2002的链接格式
+        if format_type == 'legacy' and not any(advisories.values()):
+            for href in hrefs:
+                for data_type, pattern in self._LEGACY_DIR_RES.items():
+                    if pattern.search(href):
                         full_url = urljoin(cyclone_url, href)
-                        advisories[short_name].append(full_url)
+                        advisories[data_type].append(full_url)
         
         # 对每种类型的链接排序
         for key in advisories:
@@ -390,15 +648,33 @@ class NOAACompleteCrawler:
         return advisories
     
     def download_advisory(self, url: str, save_path: Path) -> bool:
-        """下载单个预报文件"""
+        """下载单个预报文件（保存目录需已存在）"""
         content = self.fetch_page(url)
         
         if not content:
             return False
         
+        return self._save_advisory(content, save_path)
+    
+    async def _adownload(self, sem: asyncio.Semaphore, session, url: str, save_path: Path) -> bool:
+        """异步下载单个预报文件，由信号量限制对NOAA的并发数"""
+        async with sem:
+            content = await self._afetch(session, url)
+            # 随机抖动，避免请求过快
+            await asyncio.sleep(random.uniform(0, self.request_delay))
+        
+        if not content:
+            return False
+        
+        return await asyncio.to_thread(self._save_advisory, content, save_path)
+    
+    def _save_advisory(self, content: str, save_path: Path) -> bool:
+        """将预报文件内容保存为文本（HTML页面只保留<pre>部分）"""
         # 检查是否是纯文本格式（旧格式文件）
         # 如果内容不包含HTML标签，说明是纯文本
-        is_plain_text = not ('<html' in content.lower() or '<body' in content.lower() or '<!doctype' in content.lower())
+        # NOAA的HTML页面在开头1KB内必有doctype/html/body标签，只检查这一段
+        head = content[:1024].lower()
+        is_plain_text = not any(tag in head for tag in ('<html', '<body', '<!doctype'))
         
         if is_plain_text:
             # 纯文本，直接保存
@@ -412,42 +688,36 @@ class NOAACompleteCrawler:
                 text_content = content
                 save_path = save_path.with_suffix('.html')
         
-        # 保存文件
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(save_path, 'w', encoding='utf-8') as f:
-            f.write(text_content)
+        # 保存文件（目录由 _plan_downloads 预先创建），一次编码后按字节写入
+        save_path.write_bytes(text_content.encode('utf-8'))
         
         return True
     
-    def crawl_cyclone(self, year: int, cyclone: Dict[str, str]) -> int:
-        """爬取单个气旋的所有数据"""
-        cyclone_id = cyclone['id']
+    def _plan_downloads(
+        self, year: int, cyclone: Dict[str, str], advisories: Dict[str, List[str]]
+    ) -> List[Tuple[str, int, List[Tuple[str, Path]]]]:
+        """按数据类型整理待下载文件，返回 (类型全名, 链接数, [(url, 保存路径)])，已存在的文件被跳过"""
         cyclone_name = cyclone['name']
         format_type = cyclone.get('format', 'new')
         basin = cyclone.get('basin', 'Unknown')
         
-        print(f"\n  处理气旋: {cyclone['full_name']} ({cyclone_id}) - {basin}")
-        
-        # 获取所有预报文件链接
-        advisories = self.get_cyclone_advisories(cyclone['url'], cyclone_id, year, format_type)
-        
-        files_downloaded = 0
-        
-        # 下载每种类型的数据
+        plan = []
         for short_name, full_name in self.DATA_TYPES.items():
             urls = advisories.get(short_name, [])
             
             if not urls:
-                # print(f"    ⚠ {full_name}: 无数据")
                 continue
             
-            print(f"    {full_name}: {len(urls)} 个文件", end='')
-            
-            # 创建目录: 年份/海区/气旋名/数据类型/
+            # 目录: 年份/海区/气旋名/数据类型/
             save_dir = self.output_dir / str(year) / basin / cyclone_name / full_name
             
-            downloaded_count = 0
-            # 下载每个文件
+            # 一次列出目录，代替逐个文件 stat
+            try:
+                existing = set(os.listdir(save_dir))
+            except FileNotFoundError:
+                existing = set()
+            
+            pending = []
             for idx, url in enumerate(urls, 1):
                 # 从URL提取文件名
                 filename = url.split('/')[-1].replace('.shtml', '.txt').replace('.html', '.txt')
@@ -456,27 +726,105 @@ class NOAACompleteCrawler:
                 if format_type == 'legacy' and not filename.endswith('.txt'):
                     filename = f"{cyclone_name.lower()}_advisory_{idx:03d}.txt"
                 
-                save_path = save_dir / filename
-                
                 # 如果文件已存在，跳过
-                if save_path.exists():
+                if filename in existing:
                     continue
                 
-                # 下载
-                if self.download_advisory(url, save_path):
+                pending.append((url, save_dir / filename))
+            
+            if pending:
+                save_dir.mkdir(parents=True, exist_ok=True)
+            
+            plan.append((full_name, len(urls), pending))
+        
+        return plan
+    
+    def _throttle(self) -> None:
+        """等待到共享的下一个下载时间点，使所有线程合计的下载间隔不小于request_delay"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait = self._next_download_at - now
+            self._next_download_at = max(now, self._next_download_at) + self.request_delay
+        if wait > 0:
+            time.sleep(wait)
+    
+    def crawl_cyclone(self, year: int, cyclone: Dict[str, str]) -> int:
+        """爬取单个气旋的所有数据"""
+        cyclone_id = cyclone['id']
+        format_type = cyclone.get('format', 'new')
+        basin = cyclone.get('basin', 'Unknown')
+        
+        # 多个气旋在线程中并行处理，输出先收集再一次性打印，避免交错
+        lines = [f"\n  处理气旋: {cyclone['full_name']} ({cyclone_id}) - {basin}"]
+        
+        # 获取所有预报文件链接
+        advisories = self.get_cyclone_advisories(cyclone['url'], cyclone_id, year, format_type)
+        
+        files_downloaded = 0
+        
+        # 下载每种类型的数据
+        for full_name, url_count, pending in self._plan_downloads(year, cyclone, advisories):
+            downloaded_count = 0
+            # 下载每个文件
+            for url, save_path in pending:
+                # 避免请求过快（与其他线程共享同一个速率）
+                self._throttle()
+                success = self.download_advisory(url, save_path)
+                with self._stats_lock:
+                    if success:
+                        self.stats['files_downloaded'] += 1
+                    else:
+                        self.stats['files_failed'] += 1
+                if success:
                     files_downloaded += 1
                     downloaded_count += 1
-                    self.stats['files_downloaded'] += 1
-                else:
-                    self.stats['files_failed'] += 1
-                
-                # 避免请求过快
-                time.sleep(0.3)
             
-            if downloaded_count > 0:
-                print(f" - 新下载 {downloaded_count} 个")
-            else:
-                print(f" - 已存在")
+            lines.append(self._download_summary(full_name, url_count, downloaded_count))
+        
+        print('\n'.join(lines))
+        return files_downloaded
+    
+    @staticmethod
+    def _download_summary(full_name: str, url_count: int, downloaded_count: int) -> str:
+        """单个数据类型的下载结果摘要"""
+        if downloaded_count > 0:
+            return f"    {full_name}: {url_count} 个文件 - 新下载 {downloaded_count} 个"
+        return f"    {full_name}: {url_count} 个文件 - 已存在"
+    
+    async def acrawl_cyclone(self, session, sem: asyncio.Semaphore, year: int, cyclone: Dict[str, str]) -> int:
+        """异步爬取单个气旋的所有数据，所有预报文件并发下载"""
+        cyclone_id = cyclone['id']
+        format_type = cyclone.get('format', 'new')
+        basin = cyclone.get('basin', 'Unknown')
+        
+        print(f"\n  处理气旋: {cyclone['full_name']} ({cyclone_id}) - {basin}")
+        
+        async with sem:
+            html = await self._afetch(
+                session, cyclone['url'], cache_meta_path=self._http_cache_path(cyclone['url'])
+            )
+        
+        advisories = (
+            await asyncio.to_thread(
+                self.parse_cyclone_advisories, html, cyclone['url'], cyclone_id, year, format_type
+            )
+            if html else {}
+        )
+        plan = await asyncio.to_thread(self._plan_downloads, year, cyclone, advisories)
+        
+        results = await asyncio.gather(*[
+            asyncio.gather(*[self._adownload(sem, session, url, save_path) for url, save_path in pending])
+            for _, _, pending in plan
+        ])
+        
+        files_downloaded = 0
+        for (full_name, url_count, _), outcomes in zip(plan, results):
+            downloaded_count = sum(outcomes)
+            files_downloaded += downloaded_count
+            self.stats['files_downloaded'] += downloaded_count
+            self.stats['files_failed'] += len(outcomes) - downloaded_count
+            
+            print(self._download_summary(full_name, url_count, downloaded_count))
         
         return files_downloaded
     
@@ -495,10 +843,39 @@ class NOAACompleteCrawler:
         
         total_files = 0
         
-        # 处理每个气旋
+        # 各气旋的URL和目录互不相关，用线程池并行处理（连接池大小足以支撑并发）
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [executor.submit(self.crawl_cyclone, year, cyclone) for cyclone in cyclones]
+            for future in as_completed(futures):
+                total_files += future.result()
+                with self._stats_lock:
+                    self.stats['cyclones_processed'] += 1
+        
+        self.stats['years_processed'] += 1
+        print(f"\n  年份 {year} 完成，共下载 {total_files} 个文件")
+        
+        return total_files
+    
+    async def acrawl_year(self, session, sem: asyncio.Semaphore, year: int) -> int:
+        """异步爬取指定年份的所有数据"""
+        print(f"\n{'='*70}")
+        print(f"处理年份: {year}")
+        print(f"{'='*70}")
+        
+        async with sem:
+            year_url = f"{self.base_url}{year}/"
+            html = await self._afetch(session, year_url, cache_meta_path=self._http_cache_path(year_url))
+        
+        cyclones = await asyncio.to_thread(self.parse_year_cyclones, html, year) if html else []
+        
+        if not cyclones:
+            print(f"  ⚠ {year}年无数据或无法访问")
+            return 0
+        
+        total_files = 0
+        
         for cyclone in cyclones:
-            files = self.crawl_cyclone(year, cyclone)
-            total_files += files
+            total_files += await self.acrawl_cyclone(session, sem, year, cyclone)
             self.stats['cyclones_processed'] += 1
         
         self.stats['years_processed'] += 1
@@ -506,6 +883,16 @@ class NOAACompleteCrawler:
         
         return total_files
     
+    async def _acrawl_years(self, years: List[int]):
+        """在同一个aiohttp会话中依次异步爬取多个年份"""
+        sem = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=self.concurrency)
+        headers = {'User-Agent': self.session.headers['User-Agent']}
+        
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            for year in years:
+                await self.acrawl_year(session, sem, year)
+    
     def crawl_years(self, years: List[int]):
         """批量爬取多个年份"""
         print(f"\n{'='*70}")
@@ -516,8 +903,12 @@ class NOAACompleteCrawler:
         
         start_time = time.time()
         
-        for year in years:
-            self.crawl_year(year)
+        if aiohttp is not None and not loop_running():
+            asyncio.run(self._acrawl_years(years))
+        else:
+            # 未安装aiohttp或已处于事件循环中（如Jupyter）时退回同步逐年爬取
+            for year in years:
+                self.crawl_year(year)
         
         elapsed = time.time() - start_time
         
@@ -548,32 +939,21 @@ class NOAACompleteCrawler:
         print(f"已下载数据列表: {search_dir}")
         print(f"{'='*70}")
         
-        for year_dir in sorted(search_dir.iterdir()):
-            if not year_dir.is_dir():
-                continue
-            
+        for year_dir in _sorted_subdirs(search_dir):
             print(f"\n{year_dir.name}/")
             
             # 遍历海区目录
-            for basin_dir in sorted(year_dir.iterdir()):
-                if not basin_dir.is_dir():
-                    continue
-                
+            for basin_dir in _sorted_subdirs(year_dir.path):
                 print(f"  {basin_dir.name}/")
                 
                 # 遍历气旋目录
-                for cyclone_dir in sorted(basin_dir.iterdir()):
-                    if not cyclone_dir.is_dir():
-                        continue
-                    
+                for cyclone_dir in _sorted_subdirs(basin_dir.path):
                     print(f"    {cyclone_dir.name}/")
                     
                     # 遍历数据类型目录
-                    for data_type_dir in sorted(cyclone_dir.iterdir()):
-                        if not data_type_dir.is_dir():
-                            continue
-                        
-                        file_count = len(list(data_type_dir.glob('*.txt')))
+                    for data_type_dir in _sorted_subdirs(cyclone_dir.path):
+                        with os.scandir(data_type_dir.path) as entries:
+                            file_count = sum(1 for entry in entries if entry.name.endswith('.txt'))
                         print(f"      {data_type_dir.name}/  ({file_count} 文件)")
 
 
@@ -597,7 +977,7 @@ class NOAAArchiveCrawler:
         self.base_url = base_url
         self.output_dir = Path(output_dir)
         self.timeout = timeout
-        self.session = requests.Session()
+        self.session = _configure_session(requests.Session())
 
         self.session.headers.update(
             {
@@ -629,7 +1009,7 @@ class NOAAArchiveCrawler:
         response.raise_for_status()
 
         print(f"✓ 成功获取页面 (状态码: {response.status_code})")
-        return response.text
+        return _response_text(response)
 
     def save_html(
         self,
@@ -682,7 +1062,7 @@ class NOAAArchiveCrawler:
 
     def parse_archive_index(self, html_content: str) -> List[Dict[str, str]]:
         """解析档案索引页面，提取所有年份链接."""
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, _PARSER, parse_only=_ADV_STRAINER)
         links: List[Dict[str, str]] = []
 
         for link in soup.find_all("a", href=True):
@@ -730,11 +1110,16 @@ class NOAAArchiveCrawler:
 class NOAAForecastExtractor:
     """NOAA飓风预报文本提取器."""
 
+    # 提取结果按页面内容哈希缓存（NOAA档案页面不会变化）；小页面直接解析比计算哈希更划算
+    CACHE_SIZE = 1024
+    CACHE_MIN_LENGTH = 4096
+
     def __init__(self, output_dir: str = "data/output/raw/noaa_forecasts"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._forecast_cache: "OrderedDict[bytes, Optional[str]]" = OrderedDict()
 
-        self.session = requests.Session()
+        self.session = _configure_session(requests.Session())
         self.session.headers.update(
             {
                 "User-Agent": (
@@ -751,31 +1136,53 @@ class NOAAForecastExtractor:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             print(f"✓ 成功获取 (状态码: {response.status_code})")
-            return response.text
+            return _response_text(response)
         except Exception as exc:
             print(f"✗ 获取失败: {exc}")
             return None
 
     def extract_forecast_text(self, html_content: str) -> Optional[str]:
-        """从HTML中提取预报文本内容."""
-        soup = BeautifulSoup(html_content, "html.parser")
+        """从HTML中提取预报文本内容（较大页面的结果按内容哈希缓存）."""
+        if len(html_content) <= self.CACHE_MIN_LENGTH:
+            forecast_text = self._extract_forecast_text(html_content)
+        else:
+            key = hashlib.blake2b(html_content.encode("utf-8"), digest_size=16).digest()
+            if key in self._forecast_cache:
+                self._forecast_cache.move_to_end(key)
+                forecast_text = self._forecast_cache[key]
+            else:
+                forecast_text = self._extract_forecast_text(html_content)
+                self._forecast_cache[key] = forecast_text
+                if len(self._forecast_cache) > self.CACHE_SIZE:
+                    self._forecast_cache.popitem(last=False)
+
+        if forecast_text is None:
+            print("⚠ 未能提取到预报文本")
+        return forecast_text
+
+    def _extract_forecast_text(self, html_content: str) -> Optional[str]:
+        """依次尝试<pre>、正文div和ZCZC...NNNN标记提取预报文本."""
+        forecast_text = _extract_pre_text(html_content)
+        if forecast_text is not None and len(forecast_text) > 100:
+            return forecast_text
+
+        # 剩余情况直接在lxml树上取节点文本，不经过BeautifulSoup的对象封装
+        root = _lxml_root(html_content)
+        if root is None:
+            return None
 
-        pre_tags = soup.find_all("pre")
-        if pre_tags:
-            forecast_pre = max(pre_tags, key=lambda tag: len(tag.get_text()))
-            forecast_text = forecast_pre.get_text().strip()
+        pre_texts = [pre.text_content() for pre in root.iter("pre")]
+        if pre_texts:
+            forecast_text = max(pre_texts, key=len).strip()
             if len(forecast_text) > 100:
                 return forecast_text
 
-        content_divs = soup.find_all(
-            "div", class_=["textproduct", "text-product", "forecast-text"]
-        )
-        for div in content_divs:
-            text = div.get_text().strip()
+        for div in _FORECAST_DIV_XPATH(root):
+            text = div.text_content().strip()
             if len(text) > 100:
                 return text
 
-        text = soup.get_text()
+        text = root.text_content()
         if "ZCZC" in text:
             lines = text.split("\n")
             in_forecast = False
@@ -791,7 +1198,6 @@ class NOAAForecastExtractor:
             if forecast_lines:
                 return "\n".join(forecast_lines).strip()
 
-        print("⚠ 未能提取到预报文本")
         return None
 
     def save_forecast(
@@ -803,8 +1209,7 @@ class NOAAForecastExtractor:
     ) -> Path:
         """保存预报文本到文件."""
         txt_file = self.output_dir / f"{filename}.txt"
-        with open(txt_file, "w", encoding="utf-8") as file:
-            file.write(forecast_text)
+        write_text_atomic(txt_file, forecast_text)
 
         print(f"✓ 预报文本已保存: {txt_file}")
         print(f"  文本长度: {len(forecast_text):,} 字符")
@@ -812,12 +1217,39 @@ class NOAAForecastExtractor:
 
         if save_html and html_content:
             html_file = self.output_dir / f"{filename}.html"
-            with open(html_file, "w", encoding="utf-8") as file:
-                file.write(html_content)
+            write_text_atomic(html_file, html_content)
             print(f"✓ HTML已保存: {html_file}")
 
         return txt_file
 
+    @staticmethod
+    def _default_filename(url: str) -> str:
+        """由URL推导保存文件名."""
+        url_parts = url.rstrip("/").split("/")
+        return (
+            url_parts[-1].replace(".shtml", "").replace(".html", "")
+            if url_parts
+            else f"forecast_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        )
+
+    def _save_result(
+        self,
+        filename: str,
+        forecast_text: Optional[str],
+        html_content: str,
+        save_html: bool = False,
+    ) -> Path:
+        """保存提取结果；未提取到预报文本时保存原始HTML供检查."""
+        if forecast_text:
+            return self.save_forecast(forecast_text, filename, save_html, html_content)
+
+        print("⚠ 未能提取预报文本，保存原始HTML供检查")
+        html_file = self.output_dir / f"{filename}_raw.html"
+        with open(html_file, "w", encoding="utf-8") as file:
+            file.write(html_content)
+        print(f"✓ 原始HTML已保存: {html_file}")
+        return html_file
+
     def fetch_and_extract(
         self,
         url: str,
@@ -826,33 +1258,65 @@ class NOAAForecastExtractor:
     ) -> Optional[Path]:
         """获取页面并提取预报文本."""
         if filename is None:
-            url_parts = url.rstrip("/").split("/")
-            filename = (
-                url_parts[-1].replace(".shtml", "").replace(".html", "")
-                if url_parts
-                else f"forecast_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-            )
+            filename = self._default_filename(url)
 
         html_content = self.fetch_page(url)
         if not html_content:
             return None
 
         forecast_text = self.extract_forecast_text(html_content)
-        if not forecast_text:
-            print("⚠ 未能提取预报文本，保存原始HTML供检查")
-            save_html = True
-
-        if forecast_text:
-            return self.save_forecast(forecast_text, filename, save_html, html_content)
+        return self._save_result(filename, forecast_text, html_content, save_html)
 
-        if save_html:
-            html_file = self.output_dir / f"{filename}_raw.html"
-            with open(html_file, "w", encoding="utf-8") as file:
-                file.write(html_content)
-            print(f"✓ 原始HTML已保存: {html_file}")
-            return html_file
+    def fetch_and_extract_many(
+        self,
+        urls: Iterable[str],
+        save_html: bool = False,
+        max_workers: int = 20,
+    ) -> List[Optional[Path]]:
+        """批量获取页面并提取预报文本，返回值与urls顺序一致（失败为None）.
 
-        return None
+        网络获取在线程池中并发进行，提取在当前线程按完成顺序处理，
+        写盘交给单独的写线程，三个阶段相互重叠。
+        """
+        urls = list(urls)
+        results: List[Optional[Path]] = [None] * len(urls)
+        save_queue: "queue.Queue[Optional[Tuple[int, str, Optional[str], str]]]" = queue.Queue()
+
+        def writer() -> None:
+            while True:
+                job = save_queue.get()
+                if job is None:
+                    return
+                index, filename, forecast_text, html_content = job
+                try:
+                    results[index] = self._save_result(
+                        filename, forecast_text, html_content, save_html
+                    )
+                except OSError as exc:
+                    print(f"✗ 保存失败 {filename}: {exc}")
+
+        writer_thread = threading.Thread(target=writer, name="noaa-forecast-writer")
+        writer_thread.start()
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self.fetch_page, url): index
+                    for index, url in enumerate(urls)
+                }
+                for future in as_completed(futures):
+                    html_content = future.result()
+                    if not html_content:
+                        continue
+                    index = futures[future]
+                    forecast_text = self.extract_forecast_text(html_content)
+                    save_queue.put(
+                        (index, self._default_filename(urls[index]), forecast_text, html_content)
+                    )
+        finally:
+            save_queue.put(None)
+            writer_thread.join()
+
+        return results
 
     def display_preview(self, forecast_text: str, lines: int = 30) -> None:
         """显示预报文本预览."""
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -10,8 +14,21 @@ from typing import Dict, Iterable, List, Optional
 
 import requests
 from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from ..utils.io import write_json
+from ..utils.aio import loop_running
+from ..utils.io import read_json, write_json, write_json_atomic
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+# 与同步会话的 urllib3 Retry 配置保持一致
+_RETRY_TOTAL = 3
+_RETRY_BACKOFF = 0.5
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
 
 
 @dataclass(slots=True)
@@ -25,6 +42,8 @@ class TavilyCrawler:
     max_results_per_keyword: int = 10
     api_base_url: str = "https://api.tavily.com/search"
     request_timeout: int = 30
+    max_workers: int = 20
+    cache_ttl_seconds: int = 86400
     session: Session = field(init=False)
     _api_key: str = field(init=False, repr=False)
 
@@ -40,28 +59,107 @@ class TavilyCrawler:
                 "Content-Type": "application/json",
                 # 修正：使用 Authorization 请求头，并添加 "Bearer " 前缀
                 "Authorization": f"Bearer {self._api_key}",
+                # JSON 响应压缩率高，显式声明 gzip 并保持长连接
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
             }
         )
+        # 连接池与并发检索线程数一致，复用已建立的连接；
+        # 限流 (429) 与临时性 5xx 自动退避重试，检索请求可安全重放
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers,
+            max_retries=Retry(
+                total=_RETRY_TOTAL,
+                backoff_factor=_RETRY_BACKOFF,
+                status_forcelist=_RETRY_STATUSES,
+                allowed_methods=frozenset({"POST"}),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Releases the pooled connections of the shared session."""
+        self.session.close()
+
+    def __enter__(self) -> "TavilyCrawler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def crawl(self) -> List[Dict]:
-        """Fetches search results for all configured keywords."""
+        """Fetches search results for all configured keywords concurrently.
+
+        Uses ``crawl_async`` when aiohttp is installed and no event loop is
+        running in this thread (``asyncio.run`` cannot nest, e.g. inside a
+        notebook); otherwise a thread pool over the shared session. Results
+        keep the order of ``keywords``.
+        """
+        if aiohttp is not None and not loop_running():
+            return asyncio.run(self.crawl_async())
         aggregated: List[Dict] = []
-        for keyword in self.keywords:
-            aggregated.extend(self._search_keyword(keyword))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for results in executor.map(self._search_keyword, self.keywords):
+                aggregated.extend(results)
         return aggregated
 
-    def _search_keyword(self, keyword: str) -> List[Dict]:
-        payload = {
-            "query": keyword,
-            "search_depth": self.search_depth,
-            "max_results": self.max_results_per_keyword,
-            "include_images": False,
-            "include_answer": False,
+    def _cache_path(self, keyword: str) -> Path:
+        """相同关键词与检索参数的结果缓存路径（按哈希存放在输出目录下）"""
+        key = f"{keyword}|{self.search_depth}|{self.max_results_per_keyword}"
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return Path(self.output_dir) / ".tavily_cache" / f"{digest}.json"
+
+    def _load_cached(self, cache_path: Path) -> Optional[List[Dict]]:
+        """缓存存在且未超过 ``cache_ttl_seconds`` 时返回缓存结果"""
+        if self.cache_ttl_seconds <= 0:
+            return None
+        try:
+            age = time.time() - cache_path.stat().st_mtime
+        except FileNotFoundError:
+            return None
+        if age >= self.cache_ttl_seconds:
+            return None
+        try:
+            return read_json(cache_path)
+        except ValueError:
+            # 损坏的缓存文件视为未命中，重新请求后覆盖
+            return None
+
+    def _store_cached(self, cache_path: Path, results: List[Dict]) -> None:
+        if self.cache_ttl_seconds > 0:
+            # 原子替换，中断的运行或重复关键词的并发写入不会留下半截文件
+            write_json_atomic(cache_path, results)
+
+    async def crawl_async(self) -> List[Dict]:
+        """Issues every keyword query on one aiohttp session, at most
+        ``max_workers`` in flight at a time."""
+        sem = asyncio.BoundedSemaphore(self.max_workers)
+        connector = aiohttp.TCPConnector(limit=self.max_workers)
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout)
+        headers = {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self._api_key}",
         }
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, headers=headers
+        ) as session:
+            batches = await asyncio.gather(
+                *(self._search_keyword_async(session, sem, keyword) for keyword in self.keywords)
+            )
+        return [item for batch in batches for item in batch]
+
+    def _search_keyword(self, keyword: str) -> List[Dict]:
+        cache_path = self._cache_path(keyword)
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            return cached
         try:
             response: Response = self.session.post(
                 self.api_base_url,
-                json=payload,
+                json=self._payload(keyword),
                 timeout=self.request_timeout,
             )
             response.raise_for_status()
@@ -73,6 +171,50 @@ class TavilyCrawler:
             raise RuntimeError(f"调用 Tavily API 时发生网络错误: {exc}") from exc
 
         data = response.json() if response.content else {}
+        results = self._normalize(keyword, data)
+        self._store_cached(cache_path, results)
+        return results
+
+    async def _search_keyword_async(
+        self, session, sem: asyncio.BoundedSemaphore, keyword: str
+    ) -> List[Dict]:
+        cache_path = self._cache_path(keyword)
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            return cached
+        payload = self._payload(keyword)
+        async with sem:
+            for attempt in range(_RETRY_TOTAL + 1):
+                try:
+                    async with session.post(self.api_base_url, json=payload) as response:
+                        if response.status in _RETRY_STATUSES and attempt < _RETRY_TOTAL:
+                            await asyncio.sleep(_RETRY_BACKOFF * (2 ** attempt))
+                            continue
+                        body = await response.read()
+                        if response.status >= 400:  # pragma: no cover - network guard
+                            raise RuntimeError(
+                                f"Tavily API 请求失败 (状态码 {response.status}): "
+                                f"{body.decode('utf-8', errors='replace')}"
+                            )
+                        data = await response.json(content_type=None) if body else {}
+                        break
+                except (aiohttp.ClientError, asyncio.TimeoutError) as exc:  # pragma: no cover - network guard
+                    raise RuntimeError(f"调用 Tavily API 时发生网络错误: {exc}") from exc
+        results = self._normalize(keyword, data)
+        self._store_cached(cache_path, results)
+        return results
+
+    def _payload(self, keyword: str) -> Dict:
+        return {
+            "query": keyword,
+            "search_depth": self.search_depth,
+            "max_results": self.max_results_per_keyword,
+            "include_images": False,
+            "include_answer": False,
+        }
+
+    @staticmethod
+    def _normalize(keyword: str, data: Dict) -> List[Dict]:
         now = datetime.utcnow().isoformat()
         results: List[Dict] = []
         for item in data.get("results", []):
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from typing import Dict, List, Optional
 
@@ -32,42 +33,51 @@ class GreenPowerPipeline:
         self.paths = self.config.paths()
         logger.debug("Pipeline initialised with config %s", self.config)
 
-    def run_all(self) -> PipelineResult:
+    def run_all(self, force: bool = False) -> PipelineResult:
         logger.info("启动完整分析流程")
         self._write_config()
-        raw_file = self.crawl()
-        processed = self.preprocess()
+        # 爬取阶段主要等待网络，同时在后台线程加载 jieba 词典
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            preprocessor_future = executor.submit(self._build_preprocessor)
+            raw_file = self.crawl()
+            preprocessor = preprocessor_future.result()
+        processed = self.preprocess(preprocessor)
         analysis_report = self.analyze()
-        reporting_outputs = self.report()
+        reporting_outputs = self.report(force=force)
         logger.info("分析流程完成")
         return PipelineResult(raw_file, processed, analysis_report, reporting_outputs)
 
     def crawl(self) -> str:
         logger.info("阶段一: 调用 Tavily 执行数据检索")
-        crawler = TavilyCrawler(
+        with TavilyCrawler(
             keywords=self.config.keywords,
             output_dir=str(self.paths.raw_dir),
             search_depth=self.config.tavily_search_depth,
             max_results_per_keyword=self.config.tavily_results_per_keyword,
             api_base_url=self.config.tavily_api_base_url,
             request_timeout=self.config.tavily_request_timeout,
-        )
-        results = crawler.crawl()
+            max_workers=self.config.tavily_max_workers,
+            cache_ttl_seconds=self.config.tavily_cache_ttl_seconds,
+        ) as crawler:
+            results = crawler.crawl()
         if not results:
             raise RuntimeError("Tavily 未返回任何结果，请检查关键词或配额")
         output_path = crawler.save(results)
         logger.info("已保存 %s 条搜索结果 -> %s", len(results), output_path)
         return output_path
 
-    def preprocess(self) -> List[str]:
+    def preprocess(self, preprocessor: Optional[TextPreprocessor] = None) -> List[str]:
         logger.info("阶段二: 文本预处理")
-        preprocessor = TextPreprocessor(self.paths.raw_dir, self.paths.processed_dir)
+        preprocessor = preprocessor or self._build_preprocessor()
         outputs = preprocessor.process_all()
         if not outputs:
             raise RuntimeError("预处理阶段未生成文件，请确认原始数据是否存在")
         logger.info("完成预处理，共输出 %d 个文件", len(outputs))
         return outputs
 
+    def _build_preprocessor(self) -> TextPreprocessor:
+        return TextPreprocessor(self.paths.raw_dir, self.paths.processed_dir)
+
     def analyze(self) -> str:
         if not self.config.openai_api_key:
             raise RuntimeError("未检测到 OPENAI_API_KEY，请在 .env 或环境变量中配置后重试")
@@ -86,11 +96,12 @@ class GreenPowerPipeline:
         logger.info("文本挖掘完成 -> %s", report_path)
         return report_path
 
-    def report(self) -> Dict:
+    def report(self, force: bool = False) -> Dict:
         logger.info("阶段四: 结果分析与可视化")
         analyzer = ResultAnalyzer(
             input_dir=str(self.paths.analysis_dir),
             output_dir=str(self.paths.output_dir),
+            force=force,
         )
         outputs = analyzer.run_analysis()
         logger.info("已生成报告和图表")
@@ -99,6 +110,7 @@ class GreenPowerPipeline:
     def _write_config(self) -> None:
         config_path = self.paths.meta_dir / "config.json"
         data = asdict(self.config)
+        data["base_dir"] = str(self.config.base_dir)
         data["paths"] = {
             "base": str(self.paths.base_dir),
             "results": str(self.paths.results_dir),
@@ -5,12 +5,80 @@
 
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Tuple
 from datetime import datetime
 import re
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+# 风暴名称前缀（"Potential Tropical Cyclone"、"Tropical Storm"、"Hurricane" 等），合并为一个模式
+_STORM_PREFIX_RE = re.compile(
+    r'^(?:Potential Tropical Cyclone|Tropical (?:Depression|Storm|Cyclone)|Hurricane)\s+',
+    re.IGNORECASE,
+)
+
+# 预报文件中常见的时间格式，按优先级排列
+_TIMESTAMP_RES = (
+    re.compile(r'(\d{1,2}:\d{2}\s+(?:AM|PM)\s+[A-Z]{3}\s+\w+\s+\w+\s+\d{1,2}\s+\d{4})'),
+    re.compile(r'(\d{4}\s+UTC\s+\w+\s+\w+\s+\d{1,2}\s+\d{4})'),
+    re.compile(r'(\d{2}/\d{4}Z)'),
+)
+
+# 风暴目录下存放预报文本的子目录
+_FORECAST_SUBDIRS = frozenset({'forecast_advisory', 'forecast_discussion'})
+
+
+@lru_cache(maxsize=4096)
+def _clean_storm_name(name: str) -> str:
+    """清理风暴名称"""
+    # 移除常见前缀
+    name = _STORM_PREFIX_RE.sub('', name)
+    
+    # 如果名称是数字（如"EIGHT"），保留
+    # 否则取第一个单词
+    words = name.strip().split()
+    if words:
+        return words[0].upper()
+    return name.upper()
+
+
+def _dir_nonempty(path: str) -> bool:
+    """目录存在且非空；只读取第一个目录项即返回"""
+    try:
+        with os.scandir(path) as entries:
+            return next(entries, None) is not None
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+
+
+def _dump_json(path: Path, data: Dict):
+    """写出缩进的JSON；优先使用orjson"""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        ))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def _read_text_file(path: str):
+    """读取文本文件；失败时返回异常对象，由调用方统一报告"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read().decode('utf-8', errors='ignore')
+    except OSError as e:
+        return e
+
 
 class CycloneMatcher:
     """气旋事件匹配器"""
@@ -31,11 +99,16 @@ class CycloneMatcher:
     def load_ibtracs_data(self) -> pd.DataFrame:
         """加载IBTrACS数据"""
         print(f"Loading IBTrACS data from {self.ibtracs_path}...")
-        self.ibtracs_data = pd.read_csv(self.ibtracs_path)
+        # 只读取匹配所需的列；风暴名称重复度高，按类别存储
+        self.ibtracs_data = pd.read_csv(
+            self.ibtracs_path,
+            usecols=['sid', 'season', 'name', 'iso_time'],
+            dtype={'name': 'category'},
+        )
         
-        # 提取年份信息
+        # 提取年份信息：iso_time 为ISO-8601格式，显式指定格式可跳过逐列的格式推断
         self.ibtracs_data['year'] = pd.to_datetime(
-            self.ibtracs_data['iso_time'], errors='coerce'
+            self.ibtracs_data['iso_time'], errors='coerce', format='ISO8601'
         ).dt.year
         
         # 清理风暴名称（转大写，去除空格）
@@ -57,43 +130,61 @@ class CycloneMatcher:
             print(f"Error: NOAA directory not found: {self.noaa_base_path}")
             return self.noaa_storms
         
-        for year_dir in sorted(self.noaa_base_path.iterdir()):
-            if not year_dir.is_dir() or not year_dir.name.isdigit():
-                continue
-                
-            year = int(year_dir.name)
+        # os.scandir 的目录项自带类型信息，判断目录时无需逐个 stat
+        with os.scandir(self.noaa_base_path) as year_entries:
+            year_dirs = sorted(
+                (entry for entry in year_entries
+                 if entry.is_dir(follow_symlinks=False) and entry.name.isdigit()),
+                key=lambda entry: entry.name,
+            )
+        
+        # 各年份目录互不相关，并行扫描；每个线程返回自己的列表，只在主线程合并
+        storms = []
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for year_storms in executor.map(self._scan_year, year_dirs):
+                storms.extend(year_storms)
+        
+        self.noaa_storms = storms
+        print(f"Found {len(self.noaa_storms)} storms in NOAA data")
+        return self.noaa_storms
+    
+    def _scan_year(self, year_dir: os.DirEntry) -> List[Dict]:
+        """扫描单个年份目录下所有海区的风暴"""
+        year = int(year_dir.name)
+        storms = []
+        
+        with os.scandir(year_dir.path) as basin_entries:
+            basin_dirs = [entry for entry in basin_entries if entry.is_dir(follow_symlinks=False)]
+        
+        for basin_dir in basin_dirs:
+            basin = basin_dir.name
             
-            for basin_dir in year_dir.iterdir():
-                if not basin_dir.is_dir():
-                    continue
-                    
-                basin = basin_dir.name
+            with os.scandir(basin_dir.path) as storm_entries:
+                storm_dirs = [entry for entry in storm_entries if entry.is_dir(follow_symlinks=False)]
+            
+            for storm_dir in storm_dirs:
+                storm_name = storm_dir.name.upper().strip()
                 
-                for storm_dir in basin_dir.iterdir():
-                    if not storm_dir.is_dir():
-                        continue
-                    
-                    storm_name = storm_dir.name.upper().strip()
-                    
-                    # 检查是否有预报文件
-                    forecast_adv_dir = storm_dir / 'forecast_advisory'
-                    forecast_disc_dir = storm_dir / 'forecast_discussion'
-                    
-                    has_advisory = forecast_adv_dir.exists() and any(forecast_adv_dir.iterdir())
-                    has_discussion = forecast_disc_dir.exists() and any(forecast_disc_dir.iterdir())
-                    
-                    if has_advisory or has_discussion:
-                        self.noaa_storms.append({
-                            'year': year,
-                            'basin': basin,
-                            'storm_name': storm_name,
-                            'storm_path': str(storm_dir),
-                            'has_advisory': has_advisory,
-                            'has_discussion': has_discussion
-                        })
+                # 检查是否有预报文件：一次列出风暴目录，只探测实际存在的子目录
+                with os.scandir(storm_dir.path) as sub_entries:
+                    subdirs = {
+                        entry.name: entry.path for entry in sub_entries
+                        if entry.name in _FORECAST_SUBDIRS and entry.is_dir()
+                    }
+                has_advisory = 'forecast_advisory' in subdirs and _dir_nonempty(subdirs['forecast_advisory'])
+                has_discussion = 'forecast_discussion' in subdirs and _dir_nonempty(subdirs['forecast_discussion'])
+                
+                if has_advisory or has_discussion:
+                    storms.append({
+                        'year': year,
+                        'basin': basin,
+                        'storm_name': storm_name,
+                        'storm_path': storm_dir.path,
+                        'has_advisory': has_advisory,
+                        'has_discussion': has_discussion
+                    })
         
-        print(f"Found {len(self.noaa_storms)} storms in NOAA data")
-        return self.noaa_storms
+        return storms
     
     def match_storms(self) -> pd.DataFrame:
         """
@@ -111,76 +202,64 @@ class CycloneMatcher:
             self.scan_noaa_directory()
         
         # 获取IBTrACS中的唯一风暴
-        ibtracs_storms = self.ibtracs_data.groupby(['sid', 'name_clean', 'year']).agg({
-            'season': 'first',
-            'iso_time': ['min', 'max']
-        }).reset_index()
-        
-        ibtracs_storms.columns = ['sid', 'name', 'year', 'season', 'start_time', 'end_time']
-        
-        # 匹配NOAA风暴
-        matched_storms = []
+        # 只对用到的列分组；sort=False 保持文件中的出现顺序，省去分组键排序
+        ibtracs_storms = (
+            self.ibtracs_data[['sid', 'name_clean', 'year', 'season', 'iso_time']]
+            .groupby(['sid', 'name_clean', 'year'], sort=False, observed=True)
+            .agg(
+                season=('season', 'first'),
+                start_time=('iso_time', 'min'),
+                end_time=('iso_time', 'max'),
+            )
+            .reset_index()
+            .rename(columns={'name_clean': 'name'})
+        )
         
-        for noaa_storm in self.noaa_storms:
-            # 基于年份和名称匹配
-            year = noaa_storm['year']
-            name = noaa_storm['storm_name']
-            
-            # 清理NOAA风暴名称（移除"Potential Tropical Cyclone"等前缀）
-            name_clean = self._clean_storm_name(name)
-            
-            # 在IBTrACS中查找匹配
-            matches = ibtracs_storms[
-                (ibtracs_storms['year'] == year) & 
-                (ibtracs_storms['name'].str.contains(name_clean, case=False, na=False))
-            ]
-            
-            if len(matches) > 0:
-                # 如果有多个匹配，取第一个
-                match = matches.iloc[0]
-                matched_storms.append({
-                    'ibtracs_sid': match['sid'],
-                    'ibtracs_name': match['name'],
-                    'year': year,
-                    'season': match['season'],
-                    'start_time': match['start_time'],
-                    'end_time': match['end_time'],
-                    'noaa_basin': noaa_storm['basin'],
-                    'noaa_name': noaa_storm['storm_name'],
-                    'noaa_path': noaa_storm['storm_path'],
-                    'has_advisory': noaa_storm['has_advisory'],
-                    'has_discussion': noaa_storm['has_discussion']
-                })
+        # 双方都取清理后名称的第一个单词作为连接键
+        ibtracs_storms['name_first'] = ibtracs_storms['name'].str.split().str[0].str.upper()
+        
+        # 匹配NOAA风暴：按 (年份, 名称) 一次哈希连接，替代逐个风暴的 str.contains 扫描
+        noaa_df = pd.DataFrame(self.noaa_storms, columns=[
+            'year', 'basin', 'storm_name', 'storm_path', 'has_advisory', 'has_discussion'
+        ])
+        # 清理NOAA风暴名称（移除"Potential Tropical Cyclone"等前缀）
+        noaa_df['name_first'] = noaa_df['storm_name'].map(_clean_storm_name)
+        
+        merged = noaa_df.merge(ibtracs_storms, on=['year', 'name_first'], how='inner')
+        # 如果有多个匹配，取第一个
+        merged = merged.drop_duplicates(subset=['storm_path'], keep='first')
+        
+        matched_df = pd.DataFrame({
+            'ibtracs_sid': merged['sid'],
+            'ibtracs_name': merged['name'],
+            'year': merged['year'],
+            'season': merged['season'],
+            'start_time': merged['start_time'],
+            'end_time': merged['end_time'],
+            'noaa_basin': merged['basin'],
+            'noaa_name': merged['storm_name'],
+            'noaa_path': merged['storm_path'],
+            'has_advisory': merged['has_advisory'],
+            'has_discussion': merged['has_discussion']
+        }).reset_index(drop=True)
         
-        matched_df = pd.DataFrame(matched_storms)
         print(f"\nMatched {len(matched_df)} storms between IBTrACS and NOAA")
         
         return matched_df
     
-    def _clean_storm_name(self, name: str) -> str:
-        """清理风暴名称"""
-        # 移除常见前缀
-        name = re.sub(r'^Potential Tropical Cyclone\s+', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'^Tropical (Depression|Storm|Cyclone)\s+', '', name, flags=re.IGNORECASE)
-        name = re.sub(r'^Hurricane\s+', '', name, flags=re.IGNORECASE)
-        
-        # 如果名称是数字（如"EIGHT"），保留
-        # 否则取第一个单词
-        words = name.strip().split()
-        if words:
-            return words[0].upper()
-        return name.upper()
-    
-    def extract_forecast_data(self, matched_storms_df: pd.DataFrame, output_dir: str) -> Dict:
+    def extract_forecast_data(self, matched_storms_df: pd.DataFrame, output_dir: str,
+                              full_content: bool = True) -> Dict:
         """
         提取预报和讨论数据
         
         Args:
             matched_storms_df: 匹配的风暴DataFrame
             output_dir: 输出目录
+            full_content: 是否同时写出包含正文的cyclone_forecasts.json；
+                为False时只写索引，每个风暴的正文处理完即释放
             
         Returns:
-            包含所有风暴预报数据的字典
+            包含所有风暴预报数据的字典；full_content为False时返回索引数据
         """
         print("\nExtracting forecast and discussion data...")
         
@@ -188,49 +267,63 @@ class CycloneMatcher:
         output_path.mkdir(parents=True, exist_ok=True)
         
         all_storms_data = {}
+        # 轻量索引：与完整JSON结构相同，但正文替换为原始txt文件路径，查询时按需读取
+        index_data = {}
         
-        for idx, row in matched_storms_df.iterrows():
-            storm_key = f"{row['year']}_{row['noaa_basin']}_{row['noaa_name']}"
+        # itertuples 返回轻量的namedtuple，避免 iterrows 为每行构造Series
+        for row in matched_storms_df.itertuples(index=False):
+            storm_key = f"{row.year}_{row.noaa_basin}_{row.noaa_name}"
             print(f"\nProcessing {storm_key}...")
             
             storm_data = {
-                'ibtracs_sid': row['ibtracs_sid'],
-                'ibtracs_name': row['ibtracs_name'],
-                'noaa_name': row['noaa_name'],
-                'year': int(row['year']),
-                'season': float(row['season']),
-                'basin': row['noaa_basin'],
-                'start_time': row['start_time'],
-                'end_time': row['end_time'],
+                'ibtracs_sid': row.ibtracs_sid,
+                'ibtracs_name': row.ibtracs_name,
+                'noaa_name': row.noaa_name,
+                'year': int(row.year),
+                'season': float(row.season),
+                'basin': row.noaa_basin,
+                'start_time': row.start_time,
+                'end_time': row.end_time,
                 'forecasts': [],
                 'discussions': []
             }
             
-            storm_path = Path(row['noaa_path'])
+            storm_path = Path(row.noaa_path)
             
             # 提取预报advisory
-            if row['has_advisory']:
+            if row.has_advisory:
                 advisory_dir = storm_path / 'forecast_advisory'
                 storm_data['forecasts'] = self._extract_text_files(advisory_dir)
             
             # 提取预报discussion
-            if row['has_discussion']:
+            if row.has_discussion:
                 discussion_dir = storm_path / 'forecast_discussion'
                 storm_data['discussions'] = self._extract_text_files(discussion_dir)
             
-            all_storms_data[storm_key] = storm_data
+            if full_content:
+                all_storms_data[storm_key] = storm_data
+            index_data[storm_key] = dict(
+                storm_data,
+                forecasts=self._index_entries(
+                    storm_path / 'forecast_advisory', storm_data['forecasts'], output_path),
+                discussions=self._index_entries(
+                    storm_path / 'forecast_discussion', storm_data['discussions'], output_path),
+            )
             
             print(f"  - Extracted {len(storm_data['forecasts'])} forecasts")
             print(f"  - Extracted {len(storm_data['discussions'])} discussions")
         
         # 保存为JSON文件
-        json_output_path = output_path / 'cyclone_forecasts.json'
-        with open(json_output_path, 'w', encoding='utf-8') as f:
-            json.dump(all_storms_data, f, indent=2, ensure_ascii=False)
+        if full_content:
+            json_output_path = output_path / 'cyclone_forecasts.json'
+            _dump_json(json_output_path, all_storms_data)
+            print(f"\nSaved forecast data to {json_output_path}")
         
-        print(f"\nSaved forecast data to {json_output_path}")
+        index_output_path = output_path / 'cyclone_forecasts_index.json'
+        _dump_json(index_output_path, index_data)
+        print(f"Saved forecast index to {index_output_path}")
         
-        return all_storms_data
+        return all_storms_data if full_content else index_data
     
     def _extract_text_files(self, directory: Path) -> List[Dict]:
         """
@@ -244,39 +337,52 @@ class CycloneMatcher:
         """
         files_data = []
         
-        if not directory.exists():
+        try:
+            with os.scandir(directory) as entries:
+                txt_paths = sorted(
+                    entry.path for entry in entries
+                    if entry.name.endswith('.txt') and entry.is_file()
+                )
+        except FileNotFoundError:
             return files_data
         
-        for file_path in sorted(directory.iterdir()):
-            if file_path.suffix == '.txt':
-                try:
-                    with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    
-                    # 提取时间戳（如果有）
-                    timestamp = self._extract_timestamp(content)
-                    
-                    files_data.append({
-                        'filename': file_path.name,
-                        'timestamp': timestamp,
-                        'content': content
-                    })
-                except Exception as e:
-                    print(f"    Warning: Failed to read {file_path}: {e}")
+        # 小文件读取以 I/O 等待为主，用线程池并发读取；map 保持文件名顺序
+        with ThreadPoolExecutor(max_workers=min(32, len(txt_paths) or 1)) as executor:
+            results = executor.map(_read_text_file, txt_paths)
+            for file_path, content in zip(txt_paths, results):
+                if isinstance(content, Exception):
+                    print(f"    Warning: Failed to read {file_path}: {content}")
+                    continue
+                
+                # 提取时间戳（如果有）
+                timestamp = self._extract_timestamp(content)
+                
+                files_data.append({
+                    'filename': os.path.basename(file_path),
+                    'timestamp': timestamp,
+                    'content': content
+                })
         
         return files_data
     
+    @staticmethod
+    def _index_entries(directory: Path, files_data: List[Dict], index_dir: Path) -> List[Dict]:
+        """去掉正文，改为记录相对索引文件所在目录的文件路径，查询时与工作目录无关"""
+        directory = os.path.relpath(directory, index_dir)
+        return [
+            {
+                'filename': item['filename'],
+                'timestamp': item['timestamp'],
+                'path': Path(directory, item['filename']).as_posix()
+            }
+            for item in files_data
+        ]
+    
     def _extract_timestamp(self, content: str) -> str:
         """从文件内容中提取时间戳"""
         # 尝试匹配常见的时间格式
-        patterns = [
-            r'(\d{1,2}:\d{2}\s+(?:AM|PM)\s+[A-Z]{3}\s+\w+\s+\w+\s+\d{1,2}\s+\d{4})',
-            r'(\d{4}\s+UTC\s+\w+\s+\w+\s+\d{1,2}\s+\d{4})',
-            r'(\d{2}/\d{4}Z)',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, content)
+        for pattern in _TIMESTAMP_RES:
+            match = pattern.search(content)
             if match:
                 return match.group(1)
         
@@ -324,6 +430,7 @@ def main():
     print(f"匹配的气旋事件: {len(matched_df)}")
     print(f"CSV输出: {csv_output}")
     print(f"JSON输出: {output_base}/cyclone_forecasts.json")
+    print(f"索引输出: {output_base}/cyclone_forecasts_index.json")
     print("="*50)
 
 
@@ -5,8 +5,33 @@
 
 import json
 import argparse
+import re
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Pattern, Sequence, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+@lru_cache(maxsize=128)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> Pattern:
+    """把一组关键词编译为一个忽略大小写的正则，每篇文本只需扫描一次"""
+    return re.compile('|'.join(re.escape(keyword) for keyword in keywords), re.IGNORECASE)
+
+
+@lru_cache(maxsize=128)
+def _keyword_bytes_pattern(keywords: Tuple[str, ...]) -> Optional[Pattern]:
+    """ASCII关键词的字节版正则，可直接在文件原始字节上搜索；含非ASCII字符时返回None"""
+    if not all(keyword.isascii() for keyword in keywords):
+        return None
+    return re.compile(
+        b'|'.join(re.escape(keyword.encode('ascii')) for keyword in keywords),
+        re.IGNORECASE,
+    )
 
 
 class CycloneDataQuery:
@@ -17,10 +42,14 @@ class CycloneDataQuery:
         初始化查询工具
         
         Args:
-            json_path: JSON文件路径
+            json_path: JSON文件路径；也可以是cyclone_forecasts_index.json，
+                此时正文只在搜索时从原始txt文件读取
         """
         self.json_path = Path(json_path)
         self.data = None
+        self._by_name: Dict[str, List[str]] = {}
+        self._by_year: Dict[int, List[str]] = {}
+        self._by_basin: Dict[str, List[str]] = {}
         self.load_data()
     
     def load_data(self):
@@ -28,11 +57,31 @@ class CycloneDataQuery:
         if not self.json_path.exists():
             raise FileNotFoundError(f"JSON file not found: {self.json_path}")
         
-        with open(self.json_path, 'r', encoding='utf-8') as f:
-            self.data = json.load(f)
+        # orjson 为C实现的解析器，在数百MB的文件上比标准库json快数倍
+        data_bytes = self.json_path.read_bytes()
+        if orjson is not None:
+            self.data = orjson.loads(data_bytes)
+        else:
+            self.data = json.loads(data_bytes)
         
+        self._build_indexes()
         print(f"Loaded data for {len(self.data)} storms")
     
+    def _build_indexes(self):
+        """一次遍历建立名称/年份/流域到storm_key的索引，查询时无需全表扫描"""
+        by_name = defaultdict(list)
+        by_year = defaultdict(list)
+        by_basin = defaultdict(list)
+        
+        for key, storm in self.data.items():
+            by_name[storm['noaa_name'].upper()].append(key)
+            by_year[storm['year']].append(key)
+            by_basin[storm['basin']].append(key)
+        
+        self._by_name = dict(by_name)
+        self._by_year = dict(by_year)
+        self._by_basin = dict(by_basin)
+    
     def list_all_storms(self) -> List[str]:
         """列出所有气旋"""
         return list(self.data.keys())
@@ -48,15 +97,11 @@ class CycloneDataQuery:
         Returns:
             匹配的气旋数据
         """
-        name_upper = name.upper()
-        matches = []
-        
-        for key, storm in self.data.items():
-            if storm['noaa_name'].upper() == name_upper:
-                if year is None or storm['year'] == year:
-                    matches.append((key, storm))
-        
-        return matches
+        return [
+            (key, self.data[key])
+            for key in self._by_name.get(name.upper(), [])
+            if year is None or self.data[key]['year'] == year
+        ]
     
     def get_storm_by_year(self, year: int) -> List[Dict]:
         """
@@ -68,7 +113,7 @@ class CycloneDataQuery:
         Returns:
             该年份的所有气旋
         """
-        return [(k, v) for k, v in self.data.items() if v['year'] == year]
+        return [(k, self.data[k]) for k in self._by_year.get(year, [])]
     
     def get_storm_by_basin(self, basin: str) -> List[Dict]:
         """
@@ -80,7 +125,7 @@ class CycloneDataQuery:
         Returns:
             该流域的所有气旋
         """
-        return [(k, v) for k, v in self.data.items() if v['basin'] == basin]
+        return [(k, self.data[k]) for k in self._by_basin.get(basin, [])]
     
     def get_storm_statistics(self) -> Dict:
         """获取统计信息"""
@@ -103,14 +148,34 @@ class CycloneDataQuery:
         
         return stats
     
-    def search_in_content(self, keyword: str, 
+    def _entry_matches(self, entry: Dict, keywords: Tuple[str, ...]) -> bool:
+        """判断预报/讨论正文是否包含关键词；索引文件中只有路径，按需读取"""
+        if 'content' in entry:
+            return _keyword_pattern(keywords).search(entry['content']) is not None
+        
+        # 索引中的路径相对于索引文件所在目录（绝对路径保持不变）
+        path = self.json_path.parent / entry['path']
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError as e:
+            print(f"Warning: Failed to read {path}: {e}")
+            return False
+        
+        # 关键词为ASCII时直接搜索原始字节，省去解码出的整份字符串
+        bytes_pattern = _keyword_bytes_pattern(keywords)
+        if bytes_pattern is not None:
+            return bytes_pattern.search(data) is not None
+        return _keyword_pattern(keywords).search(data.decode('utf-8', errors='ignore')) is not None
+    
+    def search_in_content(self, keyword: Union[str, Sequence[str]], 
                          search_in: str = 'both',
                          limit: int = 10) -> List[Dict]:
         """
         在预报和讨论内容中搜索关键词
         
         Args:
-            keyword: 搜索关键词
+            keyword: 搜索关键词，或多个关键词（命中任意一个即算匹配）
             search_in: 搜索范围 ('forecasts', 'discussions', 'both')
             limit: 最大返回结果数
             
@@ -118,14 +183,14 @@ class CycloneDataQuery:
             包含关键词的气旋列表
         """
         results = []
-        keyword_lower = keyword.lower()
+        keywords = (keyword,) if isinstance(keyword, str) else tuple(keyword)
         
         for key, storm in self.data.items():
             matches = []
             
             if search_in in ['forecasts', 'both']:
                 for forecast in storm['forecasts']:
-                    if keyword_lower in forecast['content'].lower():
+                    if self._entry_matches(forecast, keywords):
                         matches.append({
                             'type': 'forecast',
                             'filename': forecast['filename'],
@@ -134,7 +199,7 @@ class CycloneDataQuery:
             
             if search_in in ['discussions', 'both']:
                 for discussion in storm['discussions']:
-                    if keyword_lower in discussion['content'].lower():
+                    if self._entry_matches(discussion, keywords):
                         matches.append({
                             'type': 'discussion',
                             'filename': discussion['filename'],
@@ -192,7 +257,7 @@ def main():
     """命令行接口"""
     parser = argparse.ArgumentParser(description='查询气旋预报数据')
     parser.add_argument('--json', default='data/output/processed/cyclone_forecasts.json',
-                       help='JSON文件路径')
+                       help='JSON文件路径（可使用cyclone_forecasts_index.json以加快加载）')
     parser.add_argument('--stats', action='store_true',
                        help='显示统计信息')
     parser.add_argument('--list', action='store_true',
@@ -205,8 +270,8 @@ def main():
                        help='根据流域查询气旋 (Atlantic, E_Pacific, C_Pacific)')
     parser.add_argument('--info', type=str,
                        help='显示指定气旋的详细信息（使用storm_key，如：2024_Atlantic_BERYL）')
-    parser.add_argument('--search', type=str,
-                       help='在内容中搜索关键词')
+    parser.add_argument('--search', type=str, nargs='+',
+                       help='在内容中搜索关键词（可指定多个，命中任意一个即算匹配）')
     parser.add_argument('--search-in', choices=['forecasts', 'discussions', 'both'],
                        default='both', help='搜索范围')
     parser.add_argument('--limit', type=int, default=10,
@@ -271,7 +336,7 @@ def main():
     # 搜索关键词
     if args.search:
         results = query.search_in_content(args.search, args.search_in, args.limit)
-        print(f"\n=== 搜索结果: '{args.search}' ===")
+        print(f"\n=== 搜索结果: '{', '.join(args.search)}' ===")
         print(f"找到 {len(results)} 个匹配的气旋")
         for result in results:
             print(f"\n{result['storm_key']}")
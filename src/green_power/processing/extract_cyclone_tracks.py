@@ -3,16 +3,39 @@
 从IBTrACS数据中提取matched_cyclones.csv中所有气旋的时间序列数据
 """
 
+import codecs
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from datetime import datetime
 
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+
+# 轨迹提取实际用到的IBTrACS列及其类型；显式指定类型可省去逐列类型推断
+_IBTRACS_DTYPES = {
+    'sid': 'str',
+    'season': 'float64',
+    'name': 'str',
+    'iso_time': 'str',
+    # IBTrACS 坐标精度为0.1°量级，float32 的约7位有效数字足够，内存和带宽减半
+    'lat': 'float32',
+    'lon': 'float32',
+    'wmo_wind': 'float32',
+    'wmo_pres': 'float32',
+}
+
 
 class CycloneTrackExtractor:
     """气旋路径数据提取器"""
     
+    # 分块读取IBTrACS CSV时每块的行数
+    CHUNK_SIZE = 200_000
+    
     def __init__(self, ibtracs_path: str, matched_csv_path: str):
         """
         初始化提取器
@@ -28,14 +51,54 @@ class CycloneTrackExtractor:
         
     def load_data(self):
         """加载数据"""
-        print(f"Loading IBTrACS data from {self.ibtracs_path}...")
-        self.ibtracs_data = pd.read_csv(self.ibtracs_path)
-        print(f"Loaded {len(self.ibtracs_data)} IBTrACS records")
-        
-        print(f"\nLoading matched storms from {self.matched_csv_path}...")
+        print(f"Loading matched storms from {self.matched_csv_path}...")
         self.matched_storms = pd.read_csv(self.matched_csv_path)
         print(f"Loaded {len(self.matched_storms)} matched storms")
         
+        print(f"\nLoading IBTrACS data from {self.ibtracs_path}...")
+        self.ibtracs_data = self._read_ibtracs(set(self.matched_storms['ibtracs_sid'].unique()))
+        print(f"Loaded {len(self.ibtracs_data)} IBTrACS records for matched storms")
+        
+    def _read_ibtracs(self, matched_sids: set) -> pd.DataFrame:
+        """读取IBTrACS CSV，只保留匹配气旋的记录"""
+        if pyarrow is not None:
+            # 首次读取后把所需列缓存为同名Parquet文件；之后直接按列读取，并在读取时按SID过滤
+            parquet_path = self.ibtracs_path.with_suffix('.parquet')
+            if (parquet_path.exists()
+                    and parquet_path.stat().st_mtime >= self.ibtracs_path.stat().st_mtime):
+                return pd.read_parquet(
+                    parquet_path,
+                    columns=list(_IBTRACS_DTYPES),
+                    filters=[('sid', 'in', list(matched_sids))],
+                ).astype(_IBTRACS_DTYPES)
+            
+            # pyarrow 引擎多线程解析CSV，比单线程的C引擎快数倍（该引擎不支持分块读取）
+            data = pd.read_csv(
+                self.ibtracs_path,
+                usecols=list(_IBTRACS_DTYPES),
+                dtype=_IBTRACS_DTYPES,
+                engine='pyarrow',
+            )
+            try:
+                data.to_parquet(parquet_path, compression='zstd', index=False)
+                print(f"Cached IBTrACS data to {parquet_path}")
+            except OSError as e:
+                print(f"Warning: Failed to cache IBTrACS data to {parquet_path}: {e}")
+            return data[data['sid'].isin(matched_sids)].reset_index(drop=True)
+        
+        # 匹配的SID在读取前已知，分块读取并只保留这些气旋的记录，
+        # 峰值内存与匹配记录数成正比而非整个文件
+        chunks = pd.read_csv(
+            self.ibtracs_path,
+            usecols=list(_IBTRACS_DTYPES),
+            dtype=_IBTRACS_DTYPES,
+            chunksize=self.CHUNK_SIZE,
+        )
+        return pd.concat(
+            [chunk[chunk['sid'].isin(matched_sids)] for chunk in chunks],
+            ignore_index=True,
+        )
+    
     def extract_tracks(self, output_path: str):
         """
         提取匹配气旋的完整路径数据
@@ -53,65 +116,72 @@ class CycloneTrackExtractor:
         print(f"Found {len(matched_sids)} unique storm IDs")
         
         # 从IBTrACS中筛选这些气旋的所有记录
-        track_data = self.ibtracs_data[
+        track_data = self.ibtracs_data.loc[
             self.ibtracs_data['sid'].isin(matched_sids)
-        ].copy()
+        ].reset_index(drop=True)
         
         print(f"Extracted {len(track_data)} track records")
         
+        # SID 转为类别类型，后续映射、分组、去重在整数编码上进行，也省去大量重复字符串
+        track_data['sid'] = track_data['sid'].astype('category')
+        
         # 添加额外信息（从matched_storms合并）
-        storm_info = self.matched_storms[[
-            'ibtracs_sid', 'year', 'noaa_basin', 'noaa_name'
-        ]].rename(columns={'ibtracs_sid': 'sid'})
-        
-        # 合并数据
-        track_data = track_data.merge(
-            storm_info,
-            on='sid',
-            how='left'
-        )
+        storm_info = self.matched_storms.set_index('ibtracs_sid')[['noaa_basin', 'noaa_name']]
+        if storm_info.index.is_unique:
+            # 每个SID只对应一行：按SID直接映射（类别列只需映射各类别），无需merge构造中间表
+            for column in ('noaa_basin', 'noaa_name'):
+                track_data[column] = track_data['sid'].map(storm_info[column])
+        else:
+            # 同一SID对应多个NOAA风暴时保持merge的展开语义
+            track_data = track_data.merge(
+                storm_info.rename_axis('sid').reset_index(),
+                on='sid',
+                how='left'
+            )
+        track_data = track_data.astype({'sid': 'category', 'noaa_basin': 'category'})
         
         # 解析时间信息
         print("Parsing datetime information...")
-        track_data['datetime'] = pd.to_datetime(track_data['iso_time'], errors='coerce')
-        track_data['year'] = track_data['datetime'].dt.year
-        track_data['month'] = track_data['datetime'].dt.month
-        track_data['day'] = track_data['datetime'].dt.day
-        track_data['hour'] = track_data['datetime'].dt.hour
+        # iso_time 只解析一次（显式ISO-8601格式，跳过格式推断），年月日时与移动速度计算都复用该列
+        parsed = pd.to_datetime(track_data['iso_time'], errors='coerce', format='ISO8601')
+        track_data = track_data.assign(
+            datetime=parsed,
+            year=parsed.dt.year,
+            month=parsed.dt.month,
+            day=parsed.dt.day,
+            hour=parsed.dt.hour,
+        )
         
         # 计算气旋移动速度和方向
         print("Calculating storm movement speed and direction...")
         track_data = self._calculate_storm_movement(track_data)
         
-        # 重命名和选择列
-        track_data_final = pd.DataFrame()
-        track_data_final['storm_id'] = track_data['sid']
-        track_data_final['storm_name'] = track_data['name']
-        track_data_final['season'] = track_data['season']
-        track_data_final['datetime'] = track_data['iso_time']
-        track_data_final['year'] = track_data['year']
-        track_data_final['month'] = track_data['month']
-        track_data_final['day'] = track_data['day']
-        track_data_final['hour'] = track_data['hour']
-        track_data_final['latitude'] = track_data['lat']
-        track_data_final['longitude'] = track_data['lon']
-        track_data_final['max_wind_wmo'] = track_data['wmo_wind']
-        track_data_final['min_pressure_wmo'] = track_data['wmo_pres']
-        
-        # USA数据在当前IBTrACS导出中不可用，设为NaN
-        track_data_final['max_wind_usa'] = np.nan
-        track_data_final['min_pressure_usa'] = np.nan
-        
-        # 添加计算的移动速度和方向
-        track_data_final['storm_speed'] = track_data['storm_speed']
-        track_data_final['storm_direction'] = track_data['storm_direction']
-        
-        # distance_to_land需要地理数据，暂时设为NaN
-        track_data_final['distance_to_land'] = np.nan
-        
-        # 添加额外的辅助字段
-        track_data_final['noaa_name'] = track_data['noaa_name']
-        track_data_final['noaa_basin'] = track_data['noaa_basin']
+        # 重命名和选择列：一次构造，避免逐列插入引起的多次内部重排
+        track_data_final = pd.DataFrame({
+            'storm_id': track_data['sid'],
+            'storm_name': track_data['name'],
+            'season': track_data['season'],
+            'datetime': track_data['iso_time'],
+            'year': track_data['year'],
+            'month': track_data['month'],
+            'day': track_data['day'],
+            'hour': track_data['hour'],
+            'latitude': track_data['lat'],
+            'longitude': track_data['lon'],
+            'max_wind_wmo': track_data['wmo_wind'],
+            'min_pressure_wmo': track_data['wmo_pres'],
+            # USA数据在当前IBTrACS导出中不可用，设为NaN
+            'max_wind_usa': np.nan,
+            'min_pressure_usa': np.nan,
+            # 添加计算的移动速度和方向
+            'storm_speed': track_data['storm_speed'],
+            'storm_direction': track_data['storm_direction'],
+            # distance_to_land需要地理数据，暂时设为NaN
+            'distance_to_land': np.nan,
+            # 添加额外的辅助字段
+            'noaa_name': track_data['noaa_name'],
+            'noaa_basin': track_data['noaa_basin'],
+        })
         
         # 按storm_id和datetime排序
         track_data_final = track_data_final.sort_values(['storm_id', 'datetime'])
@@ -120,7 +190,7 @@ class CycloneTrackExtractor:
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
         
-        track_data_final.to_csv(output_file, index=False, encoding='utf-8-sig')
+        self._write_csv(track_data_final, output_file)
         print(f"\nSaved track data to {output_file}")
         
         # 打印统计信息
@@ -128,6 +198,19 @@ class CycloneTrackExtractor:
         
         return track_data_final
     
+    def _write_csv(self, df: pd.DataFrame, output_file: Path):
+        """写出CSV（带BOM，便于Excel识别UTF-8）；有pyarrow时使用其多线程的C++写出器"""
+        if pyarrow is None:
+            df.to_csv(output_file, index=False, encoding='utf-8-sig')
+            return
+        
+        from pyarrow import csv as pa_csv
+        
+        table = pyarrow.Table.from_pandas(df, preserve_index=False)
+        with open(output_file, 'wb') as f:
+            f.write(codecs.BOM_UTF8)
+            pa_csv.write_csv(table, f)
+    
     def _calculate_storm_movement(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         计算气旋移动速度和方向
@@ -138,136 +221,93 @@ class CycloneTrackExtractor:
         Returns:
             添加了storm_speed和storm_direction列的DataFrame
         """
-        df = df.copy()
-        df['storm_speed'] = np.nan
-        df['storm_direction'] = np.nan
-        
-        # 按气旋分组计算
-        for storm_id in df['sid'].unique():
-            mask = df['sid'] == storm_id
-            storm_data = df[mask].sort_values('datetime')
-            
-            if len(storm_data) < 2:
-                continue
-            
-            speeds = []
-            directions = []
-            
-            for i in range(len(storm_data)):
-                if i == 0:
-                    speeds.append(np.nan)
-                    directions.append(np.nan)
-                    continue
-                
-                # 获取前后两个点
-                prev_idx = storm_data.index[i-1]
-                curr_idx = storm_data.index[i]
-                
-                lat1 = storm_data.loc[prev_idx, 'lat']
-                lon1 = storm_data.loc[prev_idx, 'lon']
-                lat2 = storm_data.loc[curr_idx, 'lat']
-                lon2 = storm_data.loc[curr_idx, 'lon']
-                time1 = storm_data.loc[prev_idx, 'datetime']
-                time2 = storm_data.loc[curr_idx, 'datetime']
-                
-                # 检查数据有效性
-                if pd.isna(lat1) or pd.isna(lon1) or pd.isna(lat2) or pd.isna(lon2):
-                    speeds.append(np.nan)
-                    directions.append(np.nan)
-                    continue
-                
-                if pd.isna(time1) or pd.isna(time2):
-                    speeds.append(np.nan)
-                    directions.append(np.nan)
-                    continue
-                
-                # 计算距离（使用Haversine公式）
-                distance_km = self._haversine_distance(lat1, lon1, lat2, lon2)
-                
-                # 计算时间差（小时）
-                time_diff = (time2 - time1).total_seconds() / 3600.0
-                
-                if time_diff > 0:
-                    # 速度（km/h）
-                    speed = distance_km / time_diff
-                    speeds.append(speed)
-                    
-                    # 方向（度，北为0度，顺时针）
-                    direction = self._calculate_bearing(lat1, lon1, lat2, lon2)
-                    directions.append(direction)
-                else:
-                    speeds.append(np.nan)
-                    directions.append(np.nan)
-            
-            # 更新DataFrame
-            df.loc[mask, 'storm_speed'] = speeds
-            df.loc[mask, 'storm_direction'] = directions
+        # 按气旋编码和时间做一次 lexsort（缺失时间排在各气旋末尾），全程只在NumPy数组上操作；
+        # 排序后同一气旋的记录连续，相邻两行即为前后两个时刻，气旋之间的边界由编码的变化一次找出
+        codes = pd.Categorical(df['sid']).codes
+        times = df['datetime'].to_numpy()
+        time_keys = np.where(np.isnat(times), np.iinfo(np.int64).max, times.view(np.int64))
+        positions = np.lexsort((time_keys, codes))
+        
+        codes = codes[positions]
+        starts = np.flatnonzero(np.diff(codes)) + 1
+        
+        # 经纬度在取上一行之前一次性转换为弧度，前后两点共用同一组弧度数组
+        lat2 = np.radians(df['lat'].to_numpy())[positions]
+        lon2 = np.radians(df['lon'].to_numpy())[positions]
+        time2 = times[positions]
+        lat1 = self._previous(lat2, starts)
+        lon1 = self._previous(lon2, starts)
+        time1 = self._previous(time2, starts)
+        
+        # 计算时间差（小时）；缺失时间得到NaN
+        time_diff = (time2 - time1) / np.timedelta64(1, 'h')
+        
+        # 每个气旋的第一个点、缺失位置或时间、时间差不为正时均为NaN；
+        # 三角函数只在有效行上计算
+        valid = (
+            np.isfinite(lat1) & np.isfinite(lon1)
+            & np.isfinite(lat2) & np.isfinite(lon2)
+            & (time_diff > 0)
+        )
+        valid_positions = positions[valid]
         
-        return df
+        # 计算距离（使用Haversine公式）和方向（度，北为0度，顺时针）
+        distance_km, direction = self._haversine_and_bearing_rad(
+            lat1[valid], lon1[valid], lat2[valid], lon2[valid]
+        )
+        
+        # 结果按原始行位置写回预分配的数组，原DataFrame保持原有顺序
+        speed_arr = np.full(len(df), np.nan)
+        direction_arr = np.full(len(df), np.nan)
+        speed_arr[valid_positions] = distance_km / time_diff[valid]
+        direction_arr[valid_positions] = direction
+        
+        return df.assign(storm_speed=speed_arr, storm_direction=direction_arr)
     
-    def _haversine_distance(self, lat1: float, lon1: float, 
-                           lat2: float, lon2: float) -> float:
+    @staticmethod
+    def _previous(values: np.ndarray, starts: np.ndarray) -> np.ndarray:
+        """上一行的值；每个气旋的第一行（及整体第一行）没有上一时刻，置为缺失"""
+        previous = np.empty_like(values)
+        previous[1:] = values[:-1]
+        missing = np.datetime64('NaT') if values.dtype.kind == 'M' else np.nan
+        previous[:1] = missing
+        previous[starts] = missing
+        return previous
+    
+    def _haversine_and_bearing_rad(self, lat1: np.ndarray, lon1: np.ndarray,
+                                   lat2: np.ndarray, lon2: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        使用Haversine公式计算两点间的距离
+        一次计算两点间的距离（Haversine公式）和从点1到点2的方位角
+        
+        两个公式共用 dlon 和两端纬度的正余弦，避免重复的三角函数运算和临时数组；
+        输入已是弧度，由调用方对整列只转换一次
         
         Args:
-            lat1, lon1: 第一个点的纬度和经度（度）
-            lat2, lon2: 第二个点的纬度和经度（度）
+            lat1, lon1: 第一个点的纬度和经度数组（弧度）
+            lat2, lon2: 第二个点的纬度和经度数组（弧度）
             
         Returns:
-            距离（公里）
+            (距离（公里）, 方位角（度，北为0度，顺时针0-360）)
         """
         # 地球半径（公里）
         R = 6371.0
         
-        # 转换为弧度
-        lat1_rad = np.radians(lat1)
-        lon1_rad = np.radians(lon1)
-        lat2_rad = np.radians(lat2)
-        lon2_rad = np.radians(lon2)
+        dlat = lat2 - lat1
+        dlon = lon2 - lon1
         
-        # 差值
-        dlat = lat2_rad - lat1_rad
-        dlon = lon2_rad - lon1_rad
+        sin_lat1, cos_lat1 = np.sin(lat1), np.cos(lat1)
+        sin_lat2, cos_lat2 = np.sin(lat2), np.cos(lat2)
         
         # Haversine公式
-        a = np.sin(dlat/2)**2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon/2)**2
-        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1-a))
-        
-        distance = R * c
-        return distance
-    
-    def _calculate_bearing(self, lat1: float, lon1: float, 
-                          lat2: float, lon2: float) -> float:
-        """
-        计算从点1到点2的方位角
-        
-        Args:
-            lat1, lon1: 第一个点的纬度和经度（度）
-            lat2, lon2: 第二个点的纬度和经度（度）
-            
-        Returns:
-            方位角（度，北为0度，顺时针0-360）
-        """
-        # 转换为弧度
-        lat1_rad = np.radians(lat1)
-        lon1_rad = np.radians(lon1)
-        lat2_rad = np.radians(lat2)
-        lon2_rad = np.radians(lon2)
-        
-        # 计算方位角
-        dlon = lon2_rad - lon1_rad
+        a = np.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * np.sin(dlon / 2) ** 2
+        distance = R * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
         
-        x = np.sin(dlon) * np.cos(lat2_rad)
-        y = np.cos(lat1_rad) * np.sin(lat2_rad) - np.sin(lat1_rad) * np.cos(lat2_rad) * np.cos(dlon)
+        # 方位角，转换为0-360度
+        x = np.sin(dlon) * cos_lat2
+        y = cos_lat1 * sin_lat2 - sin_lat1 * cos_lat2 * np.cos(dlon)
+        bearing = (np.degrees(np.arctan2(x, y)) + 360) % 360
         
-        bearing_rad = np.arctan2(x, y)
-        bearing_deg = np.degrees(bearing_rad)
-        
-        # 转换为0-360度
-        bearing_deg = (bearing_deg + 360) % 360
-        
-        return bearing_deg
+        return distance, bearing
     
     def _print_statistics(self, track_data: pd.DataFrame):
         """打印统计信息"""
@@ -278,27 +318,35 @@ class CycloneTrackExtractor:
         print(f"\n总记录数: {len(track_data)}")
         print(f"唯一气旋数: {track_data['storm_id'].nunique()}")
         
-        # 按年份统计
+        # 按年份统计：先对 (气旋, 年份) 去重，再数每年的行数
         print("\n按年份分布:")
-        year_counts = track_data.groupby('year')['storm_id'].nunique().sort_index()
+        year_counts = track_data[['storm_id', 'year']].drop_duplicates().groupby('year').size()
         for year, count in year_counts.items():
             if pd.notna(year):
                 print(f"  {int(year)}: {count} 个气旋")
         
         # 按流域统计
         print("\n按流域分布:")
-        basin_counts = track_data.groupby('noaa_basin')['storm_id'].nunique()
+        basin_counts = (
+            track_data[['storm_id', 'noaa_basin']].drop_duplicates()
+            .groupby('noaa_basin', observed=True).size()
+        )
         for basin, count in basin_counts.items():
             if pd.notna(basin):
                 print(f"  {basin}: {count} 个气旋")
         
+        # 各数值列的计数、范围和均值/中位数一次聚合得到
+        metrics = track_data[
+            ['max_wind_wmo', 'min_pressure_wmo', 'storm_speed', 'storm_direction']
+        ].agg(['count', 'min', 'max', 'mean', 'median'])
+        
         # 数据完整性统计
         print("\n数据完整性:")
         total_records = len(track_data)
-        wind_wmo = track_data['max_wind_wmo'].notna().sum()
-        pres_wmo = track_data['min_pressure_wmo'].notna().sum()
-        speed_available = track_data['storm_speed'].notna().sum()
-        direction_available = track_data['storm_direction'].notna().sum()
+        wind_wmo = int(metrics.at['count', 'max_wind_wmo'])
+        pres_wmo = int(metrics.at['count', 'min_pressure_wmo'])
+        speed_available = int(metrics.at['count', 'storm_speed'])
+        direction_available = int(metrics.at['count', 'storm_direction'])
         
         print(f"  有WMO风速数据: {wind_wmo}/{total_records} ({wind_wmo/total_records*100:.1f}%)")
         print(f"  有WMO气压数据: {pres_wmo}/{total_records} ({pres_wmo/total_records*100:.1f}%)")
@@ -307,18 +355,17 @@ class CycloneTrackExtractor:
         
         # 风速和气压范围
         if wind_wmo > 0:
-            print(f"\nWMO风速范围: {track_data['max_wind_wmo'].min():.1f} - {track_data['max_wind_wmo'].max():.1f} knots")
+            print(f"\nWMO风速范围: {metrics.at['min', 'max_wind_wmo']:.1f} - {metrics.at['max', 'max_wind_wmo']:.1f} knots")
         
         if pres_wmo > 0:
-            print(f"WMO气压范围: {track_data['min_pressure_wmo'].min():.1f} - {track_data['min_pressure_wmo'].max():.1f} mb")
+            print(f"WMO气压范围: {metrics.at['min', 'min_pressure_wmo']:.1f} - {metrics.at['max', 'min_pressure_wmo']:.1f} mb")
         
         # 移动速度范围
         if speed_available > 0:
-            speed_stats = track_data['storm_speed'].describe()
             print(f"\n气旋移动速度统计 (km/h):")
-            print(f"  平均: {speed_stats['mean']:.1f}")
-            print(f"  中位数: {speed_stats['50%']:.1f}")
-            print(f"  最大: {speed_stats['max']:.1f}")
+            print(f"  平均: {metrics.at['mean', 'storm_speed']:.1f}")
+            print(f"  中位数: {metrics.at['median', 'storm_speed']:.1f}")
+            print(f"  最大: {metrics.at['max', 'storm_speed']:.1f}")
         
         # 示例数据
         print("\n示例数据（前5条记录）:")
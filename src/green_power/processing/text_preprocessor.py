@@ -2,18 +2,60 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+import multiprocessing
+import os
 import re
+import sys
 from collections import Counter
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-import jieba
-import jieba.analyse
+try:
+    # jieba_fast is a C implementation of jieba with the same API
+    import jieba_fast as jieba
+    import jieba_fast.analyse
+except ImportError:  # pragma: no cover - optional dependency
+    import jieba
+    import jieba.analyse
 
-from ..utils.io import write_json
+from ..utils.io import read_json, write_json
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional dependency
+    xxhash = None
+
+# Patterns used by cleaning and de-duplication, compiled once at import
+_TAG_RE = re.compile(r"<[^>]+>")
+_DISALLOWED_CHARS_RE = re.compile(r"[^\u4e00-\u9fa5a-zA-Z0-9\s\.,!?;:()（）。，！？；：]")
+_WS_RE = re.compile(r"\s+")
+
+# Vocabulary strings are interned so every matched factor, list entry and
+# Counter key refers to the same object and compares by identity
+_POSITIVE_WORDS = tuple(map(sys.intern, ("支持", "推广", "优势", "便利", "实惠", "可靠", "清洁", "环保")))
+_NEGATIVE_WORDS = tuple(map(sys.intern, ("困难", "障碍", "问题", "缺乏", "不足", "昂贵", "复杂")))
+
+
+def _dedup_key(text: str) -> int:
+    """64-bit digest of a normalised title or content prefix."""
+    data = text.encode("utf-8")
+    if xxhash is not None:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), "little")
+
+
+def _init_worker() -> None:
+    """Load the jieba dictionary once per worker process."""
+    jieba.initialize()
 
 
 @dataclass(slots=True)
@@ -22,11 +64,28 @@ class TextPreprocessor:
 
     input_dir: Path
     output_dir: Path
+    stopwords: Set[str] = field(init=False, repr=False)
+    green_power_keywords: Dict[str, List[str]] = field(init=False, repr=False)
+    _matcher: Optional["ahocorasick.Automaton"] = field(init=False, repr=False)
+    _terms: Set[str] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Load the dictionary up front rather than on the first document
+        jieba.initialize()
         self.stopwords = self._load_stopwords()
-        self.green_power_keywords = self._build_keyword_map()
+        self.green_power_keywords = {
+            category: [sys.intern(factor) for factor in factor_list]
+            for category, factor_list in self._build_keyword_map().items()
+        }
+        self._terms = {
+            term
+            for factor_list in self.green_power_keywords.values()
+            for term in factor_list
+        }
+        self._terms.update(_POSITIVE_WORDS)
+        self._terms.update(_NEGATIVE_WORDS)
+        self._matcher = self._build_matcher(self._terms)
 
     def _load_stopwords(self) -> Set[str]:
         return {
@@ -142,19 +201,54 @@ class TextPreprocessor:
         if not json_files:
             return []
 
+        # Files are independent; spread them over worker processes when more
+        # than one CPU is available, keeping the output order of json_files
+        workers = min(len(json_files), os.cpu_count() or 1)
+        if workers <= 1:
+            return self._process_serial(json_files)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        ) as executor:
+            return [output for output in executor.map(self._process_file, json_files) if output]
+
+    def _process_serial(self, json_files: List[Path]) -> List[str]:
+        # Writes go to a small thread pool so the next file can be cleaned
+        # while the previous outputs are still being flushed to disk
         outputs: List[str] = []
-        for json_file in json_files:
-            output = self._process_file(json_file)
-            if output:
-                outputs.append(output)
+        pending = []
+        with ThreadPoolExecutor(max_workers=2) as io_pool:
+            for path in json_files:
+                processed_path, processed, stats_path, stats = self._build_outputs(path)
+                pending.append(io_pool.submit(write_json, processed_path, processed))
+                pending.append(io_pool.submit(write_json, stats_path, stats))
+                outputs.append(str(processed_path))
+            for future in pending:
+                future.result()
         return outputs
 
     def _process_file(self, path: Path) -> str | None:
-        with path.open("r", encoding="utf-8") as handle:
-            raw_data = json.load(handle)
+        processed_path, processed, stats_path, stats = self._build_outputs(path)
+        write_json(processed_path, processed)
+        write_json(stats_path, stats)
+        return str(processed_path)
+
+    def _build_outputs(self, path: Path) -> Tuple[Path, List[Dict], Path, Dict[str, Any]]:
+        """Processed items and statistics for ``path`` with their output paths."""
+        raw_data = read_json(path)
 
         unique_data = self._remove_duplicates(raw_data)
         processed = []
+        # Statistics are accumulated while items are kept, so the processed
+        # list is walked only once
+        sources: Counter = Counter()
+        sentiments: Counter = Counter()
+        driving: Counter = Counter()
+        barrier: Counter = Counter()
+        behavior: Counter = Counter()
+        all_keywords: Counter = Counter()
+        total_length = 0
         for item in unique_data:
             try:
                 processed_item = self._categorize_content(item)
@@ -162,25 +256,45 @@ class TextPreprocessor:
                 continue
             if processed_item["quality_score"] > 10:
                 processed.append(processed_item)
+                sources[processed_item.get("source", "unknown")] += 1
+                sentiments[processed_item["sentiment"]] += 1
+                total_length += processed_item["text_length"]
+                all_keywords.update(processed_item["keywords"])
+                driving.update(processed_item["driving_factors"])
+                barrier.update(processed_item["barrier_factors"])
+                behavior.update(processed_item["behavior_factors"])
 
-        stats = self._generate_statistics(processed)
+        stats = {
+            "total_items": len(processed),
+            "source_distribution": sources,
+            "sentiment_distribution": sentiments,
+            "avg_text_length": total_length / len(processed) if processed else 0,
+            "top_keywords": all_keywords.most_common(30),
+            "driving_factors_frequency": driving,
+            "barrier_factors_frequency": barrier,
+            "behavior_factors_frequency": behavior,
+            "generated_at": datetime.now().isoformat(),
+        }
         stem = path.stem
         processed_path = self.output_dir / f"processed_{stem}.json"
         stats_path = self.output_dir / f"stats_{stem}.json"
-        write_json(processed_path, processed)
-        write_json(stats_path, stats)
-        return str(processed_path)
+        return processed_path, processed, stats_path, stats
 
     def _remove_duplicates(self, data: Iterable[Dict]) -> List[Dict]:
-        seen_titles: Set[str] = set()
-        seen_contents: Set[str] = set()
+        # Only 64-bit digests of the normalised keys are kept
+        seen_titles: Set[int] = set()
+        seen_contents: Set[int] = set()
         unique: List[Dict] = []
         for item in data:
             title = (item.get("title") or "").strip()
             content = (item.get("content") or "").strip()
-            title_key = re.sub(r"\s+", "", title.lower())
-            content_key_raw = content[:200] if len(content) > 200 else content
-            content_key = re.sub(r"\s+", "", content_key_raw.lower())
+            # One whitespace pass normalises both keys; the title and the
+            # content prefix still feed separate sets
+            title_norm, _, content_norm = _WS_RE.sub(
+                "", f"{title}\x01{content[:200]}".lower()
+            ).partition("\x01")
+            title_key = _dedup_key(title_norm)
+            content_key = _dedup_key(content_norm)
             if title_key in seen_titles or content_key in seen_contents:
                 continue
             seen_titles.add(title_key)
@@ -197,23 +311,23 @@ class TextPreprocessor:
             raise ValueError("缺少有效文本")
 
         keywords = self._extract_keywords(cleaned_text)
+        # One scan finds every factor and sentiment term; the category lists
+        # then pick their matches in their own order
+        found = self._find_terms(full_text)
         driving_factors: List[str] = []
         barrier_factors: List[str] = []
         behavior_factors: List[str] = []
         for category, factor_list in self.green_power_keywords.items():
-            for factor in factor_list:
-                if factor in full_text:
-                    if category == "驱动因素":
-                        driving_factors.append(factor)
-                    elif category == "障碍因素":
-                        barrier_factors.append(factor)
-                    else:
-                        behavior_factors.append(factor)
-
-        positive_words = ["支持", "推广", "优势", "便利", "实惠", "可靠", "清洁", "环保"]
-        negative_words = ["困难", "障碍", "问题", "缺乏", "不足", "昂贵", "复杂"]
-        positive_count = sum(1 for word in positive_words if word in full_text)
-        negative_count = sum(1 for word in negative_words if word in full_text)
+            matched = [factor for factor in factor_list if factor in found]
+            if category == "驱动因素":
+                driving_factors.extend(matched)
+            elif category == "障碍因素":
+                barrier_factors.extend(matched)
+            else:
+                behavior_factors.extend(matched)
+
+        positive_count = sum(1 for word in _POSITIVE_WORDS if word in found)
+        negative_count = sum(1 for word in _NEGATIVE_WORDS if word in found)
         sentiment = "neutral"
         if positive_count > negative_count:
             sentiment = "positive"
@@ -236,48 +350,35 @@ class TextPreprocessor:
             "processed_time": datetime.now().isoformat(),
         }
 
+    @staticmethod
+    def _build_matcher(terms: Set[str]) -> Optional["ahocorasick.Automaton"]:
+        """Aho-Corasick automaton over all terms; None when pyahocorasick is missing."""
+        if ahocorasick is None:
+            return None
+        automaton = ahocorasick.Automaton()
+        for term in terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+        return automaton
+
+    def _find_terms(self, text: str) -> Set[str]:
+        """Return every factor or sentiment term that occurs in ``text``."""
+        if self._matcher is None:
+            return {term for term in self._terms if term in text}
+        return {term for _, term in self._matcher.iter(text)}
+
     def _clean_text(self, text: str) -> str:
-        text = re.sub(r"<[^>]+>", "", text)
-        text = re.sub(r"[^\u4e00-\u9fa5a-zA-Z0-9\s\.,!?;:()（）。，！？；：]", "", text)
-        text = re.sub(r"\s+", " ", text)
-        sentences = text.split("。")
-        filtered = [s.strip() for s in sentences if 10 <= len(s.strip()) <= 500]
-        return "。".join(filtered)
+        text = _TAG_RE.sub("", text)
+        text = _DISALLOWED_CHARS_RE.sub("", text)
+        text = _WS_RE.sub(" ", text)
+        if not text:
+            return ""
+        # Each sentence is stripped once and filtered lazily while joining
+        stripped = (sentence.strip() for sentence in text.split("。"))
+        return "。".join(s for s in stripped if 10 <= len(s) <= 500)
 
     def _extract_keywords(self, text: str, top_k: int = 20) -> List[str]:
+        # extract_tags already drops words shorter than two characters, so
+        # only the project stopwords are filtered here
         keywords = jieba.analyse.extract_tags(text, topK=top_k, withWeight=False)
-        return [kw for kw in keywords if kw not in self.stopwords and len(kw) > 1]
-
-    def _generate_statistics(self, processed_data: List[Dict]) -> Dict:
-        stats = {
-            "total_items": len(processed_data),
-            "source_distribution": Counter(item.get("source", "unknown") for item in processed_data),
-            "sentiment_distribution": Counter(item.get("sentiment", "neutral") for item in processed_data),
-            "avg_text_length": (
-                sum(item.get("text_length", 0) for item in processed_data) / len(processed_data)
-                if processed_data
-                else 0
-            ),
-            "top_keywords": [],
-            "driving_factors_frequency": Counter(),
-            "barrier_factors_frequency": Counter(),
-            "behavior_factors_frequency": Counter(),
-        }
-        all_keywords: List[str] = []
-        for item in processed_data:
-            all_keywords.extend(item.get("keywords", []))
-            for factor in item.get("driving_factors", []):
-                stats["driving_factors_frequency"][factor] += 1
-            for factor in item.get("barrier_factors", []):
-                stats["barrier_factors_frequency"][factor] += 1
-            for factor in item.get("behavior_factors", []):
-                stats["behavior_factors_frequency"][factor] += 1
-
-        stats["top_keywords"] = Counter(all_keywords).most_common(30)
-        stats["source_distribution"] = dict(stats["source_distribution"])
-        stats["sentiment_distribution"] = dict(stats["sentiment_distribution"])
-        stats["driving_factors_frequency"] = dict(stats["driving_factors_frequency"])
-        stats["barrier_factors_frequency"] = dict(stats["barrier_factors_frequency"])
-        stats["behavior_factors_frequency"] = dict(stats["behavior_factors_frequency"])
-        stats["generated_at"] = datetime.now().isoformat()
-        return stats
+        return [kw for kw in keywords if kw not in self.stopwords]
@@ -7,16 +7,26 @@
 
 import json
 import os
-from typing import List, Dict
+from functools import cached_property, partial
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 from datetime import datetime
 import logging
+import matplotlib
+
+# 图表只输出为PNG文件，使用非交互式的Agg后端，避免加载GUI后端；
+# 已通过 MPLBACKEND 显式指定后端时不覆盖
+if not os.environ.get('MPLBACKEND'):
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
-import pandas as pd
 from wordcloud import WordCloud
-import seaborn as sns
-from collections import Counter
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 # 设置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei', 'Arial Unicode MS', 'DejaVu Sans']
 plt.rcParams['axes.unicode_minus'] = False
@@ -24,10 +34,138 @@ plt.rcParams['axes.unicode_minus'] = False
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# 饼图类别超过该数量时改用图例标注
+_PIE_LABEL_LIMIT = 8
+
+# HTML报告的静态头部（含样式表）和结尾模板，只在模块加载时构造一次
+_HTML_HEAD = """
+        <!DOCTYPE html>
+        <html lang="zh-CN">
+        <head>
+            <meta charset="UTF-8">
+            <meta name="viewport" content="width=device-width, initial-scale=1.0">
+            <title>中国居民绿色电力消费驱动机制与障碍分析报告</title>
+            <style>
+                body {
+                    font-family: 'Microsoft YaHei', Arial, sans-serif;
+                    line-height: 1.6;
+                    margin: 0;
+                    padding: 20px;
+                    background-color: #f5f5f5;
+                }
+                .container {
+                    max-width: 1200px;
+                    margin: 0 auto;
+                    background-color: white;
+                    padding: 30px;
+                    border-radius: 10px;
+                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+                }
+                h1 {
+                    color: #2c3e50;
+                    text-align: center;
+                    border-bottom: 3px solid #3498db;
+                    padding-bottom: 10px;
+                }
+                h2 {
+                    color: #27ae60;
+                    border-left: 4px solid #27ae60;
+                    padding-left: 15px;
+                    margin-top: 30px;
+                }
+                h3 {
+                    color: #e74c3c;
+                    margin-top: 25px;
+                }
+                .summary {
+                    background-color: #ecf0f1;
+                    padding: 20px;
+                    border-radius: 8px;
+                    margin: 20px 0;
+                }
+                .chart-container {
+                    text-align: center;
+                    margin: 20px 0;
+                }
+                .chart-container img {
+                    max-width: 100%;
+                    height: auto;
+                    border: 1px solid #ddd;
+                    border-radius: 8px;
+                    box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+                }
+                .factor-list {
+                    background-color: #f8f9fa;
+                    padding: 15px;
+                    border-radius: 5px;
+                    margin: 10px 0;
+                }
+                .recommendation {
+                    background-color: #fff3cd;
+                    border: 1px solid #ffeaa7;
+                    padding: 15px;
+                    border-radius: 5px;
+                    margin: 10px 0;
+                }
+                ul {
+                    padding-left: 20px;
+                }
+                li {
+                    margin: 5px 0;
+                }
+                .timestamp {
+                    text-align: center;
+                    color: #7f8c8d;
+                    font-style: italic;
+                    margin-top: 30px;
+                }
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <h1>中国居民绿色电力消费驱动机制与障碍分析报告</h1>
+                
+                <div class="summary">
+                    <h2>执行摘要</h2>
+        """
+
+_HTML_TAIL = '''
+                <div class="timestamp">
+                    报告生成时间: {generated_at}
+                </div>
+            </div>
+        </body>
+        </html>
+        '''
+
+
+def _cut_words(text: str) -> Iterator[str]:
+    """jieba分词；只在生成词云时导入，与预处理模块一样优先使用jieba_fast"""
+    try:
+        import jieba_fast as jieba
+    except ImportError:  # pragma: no cover - optional dependency
+        import jieba
+    return jieba.cut(text)
+
+
+def _load_json(path: str):
+    """读取JSON文件；安装了orjson时直接解析原始字节"""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 class ResultAnalyzer:
-    def __init__(self, input_dir="analysis_results", output_dir="final_output"):
+    def __init__(self, input_dir="analysis_results", output_dir="final_output", dpi=120,
+                 force=False):
         self.input_dir = input_dir
         self.output_dir = output_dir
+        # 图表用于HTML报告嵌入，默认120 DPI；需要打印质量时可传入300
+        self.dpi = dpi
+        # force=True 时忽略已有图表，全部重新生成
+        self.force = force
+        self._input_mtime = None
         os.makedirs(output_dir, exist_ok=True)
         os.makedirs(os.path.join(output_dir, 'charts'), exist_ok=True)
         os.makedirs(os.path.join(output_dir, 'reports'), exist_ok=True)
@@ -36,139 +174,103 @@ class ResultAnalyzer:
         """加载分析结果"""
         results = {}
         
-        # 查找最新的综合报告文件
-        report_files = [f for f in os.listdir(self.input_dir) 
-                       if f.startswith('comprehensive_report_') and f.endswith('.json')]
-        
-        if not report_files:
+        # 一次扫描目录，同时找出最新的综合报告和详细分析文件；
+        # 文件名带 _YYYYMMDD_HHMMSS 时间戳，按名称比较即按时间先后
+        latest_report = latest_detail = None
+        with os.scandir(self.input_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.endswith('.json'):
+                    continue
+                if name.startswith('comprehensive_report_'):
+                    if latest_report is None or name > latest_report:
+                        latest_report = name
+                elif name.startswith('detailed_analysis_'):
+                    if latest_detail is None or name > latest_detail:
+                        latest_detail = name
+        
+        if latest_report is None:
             logger.error("未找到综合报告文件")
             return {}
         
-        # 选择最新的报告文件
-        latest_report = max(report_files, key=lambda x: x.split('_')[-1])
         report_path = os.path.join(self.input_dir, latest_report)
+        self._input_mtime = os.path.getmtime(report_path)
+        results['comprehensive_report'] = _load_json(report_path)
         
-        with open(report_path, 'r', encoding='utf-8') as f:
-            results['comprehensive_report'] = json.load(f)
-        
-        # 查找详细分析结果
-        detail_files = [f for f in os.listdir(self.input_dir) 
-                       if f.startswith('detailed_analysis_') and f.endswith('.json')]
-        
-        if detail_files:
-            latest_detail = max(detail_files, key=lambda x: x.split('_')[-1])
+        # 加载详细分析结果
+        if latest_detail is not None:
             detail_path = os.path.join(self.input_dir, latest_detail)
-            
-            with open(detail_path, 'r', encoding='utf-8') as f:
-                results['detailed_analysis'] = json.load(f)
+            results['detailed_analysis'] = _load_json(detail_path)
         
         logger.info(f"加载分析结果完成: {latest_report}")
         return results
 
     def create_driving_factors_chart(self, driving_factors: Dict) -> str:
         """创建驱动因素图表"""
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-        fig.suptitle('中国居民绿色电力消费驱动因素分析', fontsize=16, fontweight='bold')
-        
-        categories = list(driving_factors.keys())[:6]  # 最多显示6个类别
-        
-        for idx, category in enumerate(categories):
-            row = idx // 3
-            col = idx % 3
-            ax = axes[row, col]
-            
-            factors = driving_factors[category]
-            if not factors:
-                ax.text(0.5, 0.5, f'{category}\n(暂无数据)', ha='center', va='center')
-                ax.set_title(category)
-                continue
-            
-            # 提取因素名称和频率
-            if isinstance(factors[0], dict):
-                factor_names = [f['factor'] if 'factor' in f else str(f) for f in factors[:5]]
-                frequencies = [f.get('frequency', 1) for f in factors[:5]]
-            else:
-                factor_names = [str(f) for f in factors[:5]]
-                frequencies = [1] * len(factor_names)
-            
-            # 创建条形图
-            bars = ax.barh(range(len(factor_names)), frequencies, color=plt.cm.Set3(idx))
-            ax.set_yticks(range(len(factor_names)))
-            ax.set_yticklabels(factor_names)
-            ax.set_title(f'{category}驱动因素')
-            ax.set_xlabel('频率')
-            
-            # 添加数值标签
-            for i, bar in enumerate(bars):
-                width = bar.get_width()
-                ax.text(width + 0.1, bar.get_y() + bar.get_height()/2, 
-                       f'{width}', ha='left', va='center')
-        
-        # 隐藏空的子图
-        for idx in range(len(categories), 6):
-            row = idx // 3
-            col = idx % 3
-            axes[row, col].set_visible(False)
-        
-        plt.tight_layout()
-        chart_path = os.path.join(self.output_dir, 'charts', 'driving_factors.png')
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-        plt.close()
-        
+        chart_path = self._render_category_grid(
+            driving_factors, '中国居民绿色电力消费驱动因素分析', '驱动因素',
+            plt.cm.Set3, 'driving_factors.png'
+        )
         logger.info(f"驱动因素图表已保存: {chart_path}")
         return chart_path
 
     def create_barriers_chart(self, barriers: Dict) -> str:
         """创建障碍因素图表"""
+        chart_path = self._render_category_grid(
+            barriers, '中国居民绿色电力消费障碍因素分析', '障碍因素',
+            plt.cm.Set1, 'barriers.png'
+        )
+        logger.info(f"障碍因素图表已保存: {chart_path}")
+        return chart_path
+
+    def _render_category_grid(self, category_dict: Dict, suptitle: str, label: str,
+                              cmap, out_name: str) -> str:
+        """按类别绘制2×3的条形图网格（每个类别显示前5个因素），驱动因素和障碍因素图表共用"""
         fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-        fig.suptitle('中国居民绿色电力消费障碍因素分析', fontsize=16, fontweight='bold')
+        fig.suptitle(suptitle, fontsize=16, fontweight='bold')
+        axes = axes.ravel()
         
-        categories = list(barriers.keys())[:6]
+        categories = list(category_dict.keys())[:6]  # 最多显示6个类别
         
         for idx, category in enumerate(categories):
-            row = idx // 3
-            col = idx % 3
-            ax = axes[row, col]
+            ax = axes[idx]
             
-            barrier_list = barriers[category]
-            if not barrier_list:
+            factors = category_dict[category]
+            if not factors:
                 ax.text(0.5, 0.5, f'{category}\n(暂无数据)', ha='center', va='center')
                 ax.set_title(category)
                 continue
             
-            # 提取障碍名称和频率
-            if isinstance(barrier_list[0], dict):
-                barrier_names = [b['factor'] if 'factor' in b else str(b) for b in barrier_list[:5]]
-                frequencies = [b.get('frequency', 1) for b in barrier_list[:5]]
+            # 提取因素名称和频率
+            head = factors[:5]
+            if isinstance(head[0], dict):
+                names = [f['factor'] if 'factor' in f else str(f) for f in head]
+                # LLM给出的频率可能是小数，按浮点保存原值
+                frequencies = np.fromiter((f.get('frequency', 1) for f in head),
+                                          dtype=float, count=len(head))
             else:
-                barrier_names = [str(b) for b in barrier_list[:5]]
-                frequencies = [1] * len(barrier_names)
+                names = [str(f) for f in head]
+                frequencies = np.ones(len(names), dtype=np.int64)
             
             # 创建条形图
-            bars = ax.barh(range(len(barrier_names)), frequencies, color=plt.cm.Set1(idx))
-            ax.set_yticks(range(len(barrier_names)))
-            ax.set_yticklabels(barrier_names)
-            ax.set_title(f'{category}障碍因素')
+            positions = np.arange(len(names))
+            bars = ax.barh(positions, frequencies, color=cmap(idx))
+            ax.set_yticks(positions)
+            ax.set_yticklabels(names)
+            ax.set_title(f'{category}{label}')
             ax.set_xlabel('频率')
             
             # 添加数值标签
-            for i, bar in enumerate(bars):
-                width = bar.get_width()
-                ax.text(width + 0.1, bar.get_y() + bar.get_height()/2, 
-                       f'{width}', ha='left', va='center')
+            ax.bar_label(bars, padding=3)
         
         # 隐藏空的子图
-        for idx in range(len(categories), 6):
-            row = idx // 3
-            col = idx % 3
-            axes[row, col].set_visible(False)
+        for ax in axes[len(categories):]:
+            ax.set_visible(False)
         
         plt.tight_layout()
-        chart_path = os.path.join(self.output_dir, 'charts', 'barriers.png')
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
+        chart_path = os.path.join(self.output_dir, 'charts', out_name)
+        self._savefig(chart_path)
         plt.close()
-        
-        logger.info(f"障碍因素图表已保存: {chart_path}")
         return chart_path
 
     def create_factor_comparison_chart(self, driving_factors: Dict, barriers: Dict) -> str:
@@ -176,34 +278,31 @@ class ResultAnalyzer:
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
         fig.suptitle('驱动因素 vs 障碍因素 对比分析', fontsize=16, fontweight='bold')
         
-        # 统计各类别的因素数量
-        driving_counts = {}
-        for category, factors in driving_factors.items():
-            driving_counts[category] = len(factors) if factors else 0
-        
-        barrier_counts = {}
-        for category, barriers_list in barriers.items():
-            barrier_counts[category] = len(barriers_list) if barriers_list else 0
+        # 统计各类别的因素数量，一次写入整型数组
+        driving_labels = list(driving_factors.keys())
+        driving_sizes = np.fromiter(
+            (len(factors) if factors else 0 for factors in driving_factors.values()),
+            dtype=np.int64, count=len(driving_labels),
+        )
+        barrier_labels = list(barriers.keys())
+        barrier_sizes = np.fromiter(
+            (len(barriers_list) if barriers_list else 0 for barriers_list in barriers.values()),
+            dtype=np.int64, count=len(barrier_labels),
+        )
         
         # 驱动因素饼图
-        if driving_counts and any(driving_counts.values()):
-            labels = list(driving_counts.keys())
-            sizes = list(driving_counts.values())
-            colors = plt.cm.Set3(np.linspace(0, 1, len(labels)))
-            
-            wedges, texts, autotexts = ax1.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%')
+        if driving_sizes.any():
+            colors = plt.cm.Set3(np.linspace(0, 1, len(driving_labels)))
+            self._draw_pie(ax1, driving_sizes, driving_labels, colors)
             ax1.set_title('驱动因素分布')
         else:
             ax1.text(0.5, 0.5, '暂无驱动因素数据', ha='center', va='center')
             ax1.set_title('驱动因素分布')
         
         # 障碍因素饼图
-        if barrier_counts and any(barrier_counts.values()):
-            labels = list(barrier_counts.keys())
-            sizes = list(barrier_counts.values())
-            colors = plt.cm.Set1(np.linspace(0, 1, len(labels)))
-            
-            wedges, texts, autotexts = ax2.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%')
+        if barrier_sizes.any():
+            colors = plt.cm.Set1(np.linspace(0, 1, len(barrier_labels)))
+            self._draw_pie(ax2, barrier_sizes, barrier_labels, colors)
             ax2.set_title('障碍因素分布')
         else:
             ax2.text(0.5, 0.5, '暂无障碍因素数据', ha='center', va='center')
@@ -211,31 +310,53 @@ class ResultAnalyzer:
         
         plt.tight_layout()
         chart_path = os.path.join(self.output_dir, 'charts', 'factor_comparison.png')
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight')
+        self._savefig(chart_path)
         plt.close()
         
         logger.info(f"对比图表已保存: {chart_path}")
         return chart_path
 
+    @staticmethod
+    def _draw_pie(ax, sizes: np.ndarray, labels: List[str], colors) -> None:
+        """绘制饼图；类别较多时不在扇区上逐个标注，改用图例列出名称和占比"""
+        if len(labels) <= _PIE_LABEL_LIMIT:
+            ax.pie(sizes, labels=labels, colors=colors, autopct='%1.1f%%')
+            return
+        
+        ax.pie(sizes, colors=colors)
+        percents = sizes * (100.0 / sizes.sum())
+        ax.legend([f'{label} {percent:.1f}%' for label, percent in zip(labels, percents)],
+                  loc='center left', bbox_to_anchor=(1, 0.5), fontsize=8)
+
+    def _savefig(self, chart_path: str) -> None:
+        """保存当前图表为PNG；使用最低的zlib压缩级别，编码更快，文件略大"""
+        plt.savefig(chart_path, dpi=self.dpi, bbox_inches='tight',
+                    pil_kwargs={'compress_level': 1})
+
+    @cached_property
+    def _wordcloud(self) -> WordCloud:
+        """词云生成器，多次生成词云时复用同一实例"""
+        return WordCloud(
+            font_path=None,  # 如果有中文字体文件可以指定路径
+            width=800,
+            height=400,
+            background_color='white',
+            max_words=100,
+            collocations=False
+        )
+
     def create_wordcloud(self, text_data: List[str], title: str) -> str:
         """创建词云图"""
         if not text_data:
             logger.warning(f"无法创建词云图 '{title}': 没有文本数据")
             return ""
         
-        # 合并所有文本
-        combined_text = ' '.join(text_data)
+        # 合并所有文本；WordCloud 按空白切词，中文需先用 jieba 分词
+        combined_text = ' '.join(_cut_words(' '.join(text_data)))
         
         try:
-            # 创建词云
-            wordcloud = WordCloud(
-                font_path=None,  # 如果有中文字体文件可以指定路径
-                width=800,
-                height=400,
-                background_color='white',
-                max_words=100,
-                collocations=False
-            ).generate(combined_text)
+            # 生成词云
+            wordcloud = self._wordcloud.generate(combined_text)
             
             # 绘制词云图
             plt.figure(figsize=(10, 5))
@@ -244,7 +365,7 @@ class ResultAnalyzer:
             plt.title(title, fontsize=16, fontweight='bold')
             
             chart_path = os.path.join(self.output_dir, 'charts', f'wordcloud_{title.replace(" ", "_")}.png')
-            plt.savefig(chart_path, dpi=300, bbox_inches='tight')
+            self._savefig(chart_path)
             plt.close()
             
             logger.info(f"词云图已保存: {chart_path}")
@@ -254,116 +375,40 @@ class ResultAnalyzer:
             logger.warning(f"创建词云图失败 '{title}': {e}")
             return ""
 
-    def generate_html_report(self, results: Dict, chart_paths: List[str]) -> str:
+    def generate_html_report(self, results: Dict, chart_paths: List[str],
+                             generated_at: Optional[str] = None) -> str:
         """生成HTML报告"""
         report = results.get('comprehensive_report', {})
+        generated_at = generated_at or self._format_timestamp()
         
-        html_content = f"""
-        <!DOCTYPE html>
-        <html lang="zh-CN">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>中国居民绿色电力消费驱动机制与障碍分析报告</title>
-            <style>
-                body {{
-                    font-family: 'Microsoft YaHei', Arial, sans-serif;
-                    line-height: 1.6;
-                    margin: 0;
-                    padding: 20px;
-                    background-color: #f5f5f5;
-                }}
-                .container {{
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    background-color: white;
-                    padding: 30px;
-                    border-radius: 10px;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                }}
-                h1 {{
-                    color: #2c3e50;
-                    text-align: center;
-                    border-bottom: 3px solid #3498db;
-                    padding-bottom: 10px;
-                }}
-                h2 {{
-                    color: #27ae60;
-                    border-left: 4px solid #27ae60;
-                    padding-left: 15px;
-                    margin-top: 30px;
-                }}
-                h3 {{
-                    color: #e74c3c;
-                    margin-top: 25px;
-                }}
-                .summary {{
-                    background-color: #ecf0f1;
-                    padding: 20px;
-                    border-radius: 8px;
-                    margin: 20px 0;
-                }}
-                .chart-container {{
-                    text-align: center;
-                    margin: 20px 0;
-                }}
-                .chart-container img {{
-                    max-width: 100%;
-                    height: auto;
-                    border: 1px solid #ddd;
-                    border-radius: 8px;
-                    box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-                }}
-                .factor-list {{
-                    background-color: #f8f9fa;
-                    padding: 15px;
-                    border-radius: 5px;
-                    margin: 10px 0;
-                }}
-                .recommendation {{
-                    background-color: #fff3cd;
-                    border: 1px solid #ffeaa7;
-                    padding: 15px;
-                    border-radius: 5px;
-                    margin: 10px 0;
-                }}
-                ul {{
-                    padding-left: 20px;
-                }}
-                li {{
-                    margin: 5px 0;
-                }}
-                .timestamp {{
-                    text-align: center;
-                    color: #7f8c8d;
-                    font-style: italic;
-                    margin-top: 30px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>中国居民绿色电力消费驱动机制与障碍分析报告</h1>
-                
-                <div class="summary">
-                    <h2>执行摘要</h2>
-        """
+        # 报告片段边生成边写入文件，不在内存中拼接整份报告
+        html_path = os.path.join(self.output_dir, 'reports', 'comprehensive_report.html')
+        with open(html_path, 'w', encoding='utf-8') as f:
+            f.writelines(self._iter_html_report(report, chart_paths, generated_at))
+        
+        logger.info(f"HTML报告已保存: {html_path}")
+        return html_path
+
+    def _iter_html_report(self, report: Dict, chart_paths: List[str],
+                          generated_at: str) -> Iterator[str]:
+        """依次生成HTML报告的各个片段"""
+        yield _HTML_HEAD
         
         # 添加执行摘要
         executive_summary = report.get('executive_summary', {})
         for key, value in executive_summary.items():
-            html_content += f"<p><strong>{key}:</strong> {value}</p>\n"
+            yield f"<p><strong>{key}:</strong> {value}</p>\n"
         
-        html_content += "</div>\n"
+        yield "</div>\n"
         
         # 添加图表
         if chart_paths:
-            html_content += '<h2>数据可视化</h2>\n'
+            yield '<h2>数据可视化</h2>\n'
             for chart_path in chart_paths:
                 if chart_path and os.path.exists(chart_path):
                     chart_name = os.path.basename(chart_path)
                     relative_path = f"charts/{chart_name}"
-                    html_content += f'''
+                    yield f'''
                     <div class="chart-container">
                         <img src="{relative_path}" alt="{chart_name}">
                     </div>
@@ -372,65 +417,57 @@ class ResultAnalyzer:
         # 添加驱动因素分析
         driving_factors = report.get('driving_factors_analysis', {})
         if driving_factors:
-            html_content += '<h2>驱动因素分析</h2>\n'
+            yield '<h2>驱动因素分析</h2>\n'
             for category, factors in driving_factors.items():
-                html_content += f'<h3>{category}</h3>\n<div class="factor-list">\n<ul>\n'
+                yield f'<h3>{category}</h3>\n<div class="factor-list">\n<ul>\n'
                 for factor in factors[:5]:  # 显示前5个因素
                     if isinstance(factor, dict):
-                        factor_name = factor.get('factor', str(factor))
-                        frequency = factor.get('frequency', 'N/A')
-                        html_content += f'<li>{factor_name} (频率: {frequency})</li>\n'
+                        yield f'<li>{factor.get("factor", str(factor))} (频率: {factor.get("frequency", "N/A")})</li>\n'
                     else:
-                        html_content += f'<li>{factor}</li>\n'
-                html_content += '</ul>\n</div>\n'
+                        yield f'<li>{factor}</li>\n'
+                yield '</ul>\n</div>\n'
         
         # 添加障碍因素分析
         barriers = report.get('barriers_analysis', {})
         if barriers:
-            html_content += '<h2>障碍因素分析</h2>\n'
+            yield '<h2>障碍因素分析</h2>\n'
             for category, barrier_list in barriers.items():
-                html_content += f'<h3>{category}</h3>\n<div class="factor-list">\n<ul>\n'
+                yield f'<h3>{category}</h3>\n<div class="factor-list">\n<ul>\n'
                 for barrier in barrier_list[:5]:
                     if isinstance(barrier, dict):
-                        barrier_name = barrier.get('factor', str(barrier))
-                        frequency = barrier.get('frequency', 'N/A')
-                        html_content += f'<li>{barrier_name} (频率: {frequency})</li>\n'
+                        yield f'<li>{barrier.get("factor", str(barrier))} (频率: {barrier.get("frequency", "N/A")})</li>\n'
                     else:
-                        html_content += f'<li>{barrier}</li>\n'
-                html_content += '</ul>\n</div>\n'
+                        yield f'<li>{barrier}</li>\n'
+                yield '</ul>\n</div>\n'
         
         # 添加建议
         recommendations = report.get('recommendations', [])
         if recommendations:
-            html_content += '<h2>政策建议</h2>\n'
+            yield '<h2>政策建议</h2>\n'
             for idx, rec in enumerate(recommendations, 1):
-                html_content += f'<div class="recommendation">建议{idx}: {rec}</div>\n'
+                yield f'<div class="recommendation">建议{idx}: {rec}</div>\n'
         
         # 添加时间戳
-        html_content += f'''
-                <div class="timestamp">
-                    报告生成时间: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}
-                </div>
-            </div>
-        </body>
-        </html>
-        '''
-        
-        # 保存HTML报告
-        html_path = os.path.join(self.output_dir, 'reports', 'comprehensive_report.html')
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        logger.info(f"HTML报告已保存: {html_path}")
-        return html_path
+        yield _HTML_TAIL.format(generated_at=generated_at)
 
-    def generate_markdown_report(self, results: Dict) -> str:
+    def generate_markdown_report(self, results: Dict, generated_at: Optional[str] = None) -> str:
         """生成Markdown格式报告"""
         report = results.get('comprehensive_report', {})
+        generated_at = generated_at or self._format_timestamp()
         
-        markdown_content = f"""# 中国居民绿色电力消费驱动机制与障碍分析报告
+        # 报告片段边生成边写入文件
+        md_path = os.path.join(self.output_dir, 'reports', 'comprehensive_report.md')
+        with open(md_path, 'w', encoding='utf-8') as f:
+            f.writelines(self._iter_markdown_report(report, generated_at))
+        
+        logger.info(f"Markdown报告已保存: {md_path}")
+        return md_path
+
+    def _iter_markdown_report(self, report: Dict, generated_at: str) -> Iterator[str]:
+        """依次生成Markdown报告的各个片段"""
+        yield f"""# 中国居民绿色电力消费驱动机制与障碍分析报告
 
-*报告生成时间: {datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')}*
+*报告生成时间: {generated_at}*
 
 ## 执行摘要
 
@@ -439,53 +476,77 @@ class ResultAnalyzer:
         # 添加执行摘要
         executive_summary = report.get('executive_summary', {})
         for key, value in executive_summary.items():
-            markdown_content += f"**{key}**: {value}\n\n"
+            yield f"**{key}**: {value}\n\n"
         
         # 添加驱动因素分析
         driving_factors = report.get('driving_factors_analysis', {})
         if driving_factors:
-            markdown_content += "## 驱动因素分析\n\n"
+            yield "## 驱动因素分析\n\n"
             for category, factors in driving_factors.items():
-                markdown_content += f"### {category}\n\n"
+                yield f"### {category}\n\n"
                 for factor in factors[:5]:
                     if isinstance(factor, dict):
-                        factor_name = factor.get('factor', str(factor))
-                        frequency = factor.get('frequency', 'N/A')
-                        markdown_content += f"- {factor_name} (频率: {frequency})\n"
+                        yield f"- {factor.get('factor', str(factor))} (频率: {factor.get('frequency', 'N/A')})\n"
                     else:
-                        markdown_content += f"- {factor}\n"
-                markdown_content += "\n"
+                        yield f"- {factor}\n"
+                yield "\n"
         
         # 添加障碍因素分析
         barriers = report.get('barriers_analysis', {})
         if barriers:
-            markdown_content += "## 障碍因素分析\n\n"
+            yield "## 障碍因素分析\n\n"
             for category, barrier_list in barriers.items():
-                markdown_content += f"### {category}\n\n"
+                yield f"### {category}\n\n"
                 for barrier in barrier_list[:5]:
                     if isinstance(barrier, dict):
-                        barrier_name = barrier.get('factor', str(barrier))
-                        frequency = barrier.get('frequency', 'N/A')
-                        markdown_content += f"- {barrier_name} (频率: {frequency})\n"
+                        yield f"- {barrier.get('factor', str(barrier))} (频率: {barrier.get('frequency', 'N/A')})\n"
                     else:
-                        markdown_content += f"- {barrier}\n"
-                markdown_content += "\n"
+                        yield f"- {barrier}\n"
+                yield "\n"
         
         # 添加建议
         recommendations = report.get('recommendations', [])
         if recommendations:
-            markdown_content += "## 政策建议\n\n"
+            yield "## 政策建议\n\n"
             for idx, rec in enumerate(recommendations, 1):
-                markdown_content += f"{idx}. {rec}\n"
-            markdown_content += "\n"
-        
-        # 保存Markdown报告
-        md_path = os.path.join(self.output_dir, 'reports', 'comprehensive_report.md')
-        with open(md_path, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+                yield f"{idx}. {rec}\n"
+            yield "\n"
+
+    @staticmethod
+    def _format_timestamp() -> str:
+        """报告中显示的生成时间"""
+        return datetime.now().strftime('%Y年%m月%d日 %H:%M:%S')
+
+    def _is_stale(self, chart_path: str) -> bool:
+        """图表不存在或早于分析结果文件时需要重新生成"""
+        if self.force or self._input_mtime is None:
+            return True
+        try:
+            return os.path.getmtime(chart_path) < self._input_mtime
+        except OSError:
+            return True
+
+    def _render_charts(self, chart_jobs: List) -> List[str]:
+        """在当前进程中依次生成图表，返回成功生成的图表路径（保持任务顺序）
         
-        logger.info(f"Markdown报告已保存: {md_path}")
-        return md_path
+        每张图约0.5秒，而spawn子进程重新导入本模块（matplotlib、wordcloud）约需0.65秒，
+        多进程绘制几乎没有收益
+        """
+        return self._collect_chart_paths(partial(func, *args) for func, args in chart_jobs)
+
+    @staticmethod
+    def _collect_chart_paths(getters: Iterable[Callable[[], str]]) -> List[str]:
+        """依次取出各图表结果；单张图表失败只记录警告，不影响其余图表"""
+        chart_paths = []
+        for get_path in getters:
+            try:
+                chart_path = get_path()
+            except Exception as e:
+                logger.warning(f"图表生成过程中出现错误: {e}")
+                continue
+            if chart_path:
+                chart_paths.append(chart_path)
+        return chart_paths
 
     def run_analysis(self) -> Dict:
         """运行结果分析"""
@@ -498,43 +559,45 @@ class ResultAnalyzer:
             return {}
         
         report = results.get('comprehensive_report', {})
-        chart_paths = []
-        
-        try:
-            # 创建驱动因素图表
-            driving_factors = report.get('driving_factors_analysis', {})
-            if driving_factors:
-                chart_path = self.create_driving_factors_chart(driving_factors)
-                if chart_path:
-                    chart_paths.append(chart_path)
-            
-            # 创建障碍因素图表
-            barriers = report.get('barriers_analysis', {})
-            if barriers:
-                chart_path = self.create_barriers_chart(barriers)
-                if chart_path:
-                    chart_paths.append(chart_path)
-            
-            # 创建对比图表
-            if driving_factors and barriers:
-                chart_path = self.create_factor_comparison_chart(driving_factors, barriers)
-                if chart_path:
-                    chart_paths.append(chart_path)
-            
-        except Exception as e:
-            logger.warning(f"图表生成过程中出现错误: {e}")
+        driving_factors = report.get('driving_factors_analysis', {})
+        barriers = report.get('barriers_analysis', {})
         
-        # 生成报告
+        # 驱动因素、障碍因素和对比图表相互独立
+        chart_jobs = []
+        if driving_factors:
+            chart_jobs.append(('driving_factors.png', self.create_driving_factors_chart,
+                               (driving_factors,)))
+        if barriers:
+            chart_jobs.append(('barriers.png', self.create_barriers_chart, (barriers,)))
+        if driving_factors and barriers:
+            chart_jobs.append(('factor_comparison.png', self.create_factor_comparison_chart,
+                               (driving_factors, barriers)))
+        
+        # 比分析结果更新的图表直接复用，只重新生成过期或缺失的图表
+        chart_targets = [os.path.join(self.output_dir, 'charts', name) for name, _, _ in chart_jobs]
+        stale = [self._is_stale(path) for path in chart_targets]
+        rendered = set(self._render_charts(
+            [(func, args) for (_, func, args), is_stale in zip(chart_jobs, stale) if is_stale]
+        ))
+        if not all(stale):
+            logger.info("分析结果未更新，复用已有图表")
+        chart_paths = [
+            path for path, is_stale in zip(chart_targets, stale)
+            if not is_stale or path in rendered
+        ]
+        
+        # 生成报告；两份报告使用同一个生成时间
         output_files = {}
+        generated_at = self._format_timestamp()
         
         try:
-            html_path = self.generate_html_report(results, chart_paths)
+            html_path = self.generate_html_report(results, chart_paths, generated_at)
             output_files['html_report'] = html_path
         except Exception as e:
             logger.warning(f"HTML报告生成失败: {e}")
         
         try:
-            md_path = self.generate_markdown_report(results)
+            md_path = self.generate_markdown_report(results, generated_at)
             output_files['markdown_report'] = md_path
         except Exception as e:
             logger.warning(f"Markdown报告生成失败: {e}")
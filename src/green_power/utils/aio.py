@@ -0,0 +1,18 @@
+"""Helpers for code that offers both synchronous and asyncio entry points."""
+
+from __future__ import annotations
+
+import asyncio
+
+
+def loop_running() -> bool:
+    """Whether an event loop is already running in the current thread.
+
+    ``asyncio.run`` cannot be nested, so synchronous wrappers use this to
+    fall back to their thread-based path (e.g. inside a notebook).
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
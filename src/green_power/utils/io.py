@@ -3,22 +3,75 @@
 from __future__ import annotations
 
 import json
+import os
+import tempfile
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 
 def read_json(path: Path) -> Any:
+    if orjson is not None:
+        payload = path.read_bytes()
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity and lone surrogates, which the
+            # standard library accepts
+            return json.loads(payload.decode("utf-8"))
     with path.open("r", encoding="utf-8") as handle:
         return json.load(handle)
 
 
+def _dump_json(data: Any) -> bytes:
+    # Serialise in memory and hand the file a single write instead of one per
+    # json.dump chunk. orjson produces the same indented UTF-8 layout directly
+    # as bytes.
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def write_json(path: Path, data: Any) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        json.dump(data, handle, ensure_ascii=False, indent=2)
+    path.write_bytes(_dump_json(data))
+
+
+def write_json_atomic(path: Path, data: Any) -> None:
+    """Like ``write_json``, but readers never observe a partially written file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_bytes_atomic(path, _dump_json(data))
 
 
 def write_text(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as handle:
-        handle.write(content)
+    path.write_bytes(content.encode("utf-8"))
+
+
+def write_text_atomic(path: Path, content: str) -> None:
+    """Write ``content`` so readers never observe a partially written file.
+
+    The data goes to a temporary file in the same directory, which is then
+    renamed over ``path`` in one step.
+    """
+    _write_bytes_atomic(path, content.encode("utf-8"))
+
+
+def _write_bytes_atomic(path: Path, payload: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        # mkstemp creates the file as 0600; use the usual permissions for output.
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except FileNotFoundError:
+            pass
+        raise